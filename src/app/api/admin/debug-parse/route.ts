@@ -6,9 +6,10 @@
  */
 
 import { NextRequest, NextResponse } from 'next/server';
-import * as cheerio from 'cheerio';
 import Groq from 'groq-sdk';
 import { cleanRecipeHTML } from '@/utils/htmlCleaner';
+import { findRecipeJsonLd } from '@/utils/aiRecipeParser';
+import { readHtmlResponse } from '@/utils/fetchRecipePage';
 
 interface DebugStep {
   step: string;
@@ -86,7 +87,8 @@ export async function GET(req: NextRequest): Promise<Response> {
       });
     }
 
-    const rawHtml = await response.text();
+    // Decode by the page's declared charset, exactly like the production fetch does
+    const rawHtml = await readHtmlResponse(response);
     steps.push({
       step: 'raw_html',
       title: 'Raw HTML Fetched',
@@ -97,7 +99,7 @@ export async function GET(req: NextRequest): Promise<Response> {
 
     // Step 2: Clean HTML
     console.log('[Debug API] Step 2: Cleaning HTML...');
-    const cleaned = cleanRecipeHTML(rawHtml);
+    const cleaned = cleanRecipeHTML(rawHtml, url);
     
     if (!cleaned.success || !cleaned.html) {
       return NextResponse.json({
@@ -117,38 +119,14 @@ export async function GET(req: NextRequest): Promise<Response> {
 
     // CHECKPOINT 2: Recipe Parsing - Try JSON-LD extraction first
     console.log('[Debug API] CHECKPOINT 2: Recipe Parsing - Attempting JSON-LD extraction...');
-    const $ = cheerio.load(cleaned.html);
     let jsonLdResult = null;
 
     try {
-      const scripts = $('script[type="application/ld+json"]');
-      for (let i = 0; i < scripts.length; i++) {
-        const scriptContent = $(scripts[i]).html();
-        if (!scriptContent) continue;
-
-        const data = JSON.parse(scriptContent);
-        const items = Array.isArray(data) ? data : [data];
-
-        for (const item of items) {
-          if (
-            item['@type'] === 'Recipe' ||
-            (item['@graph'] &&
-              Array.isArray(item['@graph']) &&
-              item['@graph'].some((g: any) => g['@type'] === 'Recipe'))
-          ) {
-            const recipe =
-              item['@type'] === 'Recipe'
-                ? item
-                : item['@graph'].find((g: any) => g['@type'] === 'Recipe');
-
-            if (recipe && recipe.name && recipe.recipeIngredient && recipe.recipeInstructions) {
-              jsonLdResult = recipe;
-              break;
-            }
-          }
-        }
-        if (jsonLdResult) break;
-      }
+      // Same shared extractor as the main parser, fed by the scripts the cleaner collected
+      jsonLdResult =
+        findRecipeJsonLd(cleaned.jsonLd || []).find(
+          (recipe) => recipe.name && recipe.recipeIngredient && recipe.recipeInstructions
+        ) || null;
     } catch (error) {
       console.log('[Debug API] JSON-LD parsing failed:', error);
     }
@@ -731,7 +709,8 @@ export async function POST(req: NextRequest): Promise<Response> {
       });
     }
 
-    const rawHtml = await response.text();
+    // Decode by the page's declared charset, exactly like the production fetch does
+    const rawHtml = await readHtmlResponse(response);
     steps.push({
       step: 'raw_html',
       title: 'Raw HTML Fetched',
@@ -742,7 +721,7 @@ export async function POST(req: NextRequest): Promise<Response> {
 
     // Step 2: Clean HTML
     console.log('[Debug API] Step 2: Cleaning HTML...');
-    const cleaned = cleanRecipeHTML(rawHtml);
+    const cleaned = cleanRecipeHTML(rawHtml, url);
     
     if (!cleaned.success || !cleaned.html) {
       return NextResponse.json({
@@ -762,38 +741,14 @@ export async function POST(req: NextRequest): Promise<Response> {
 
     // Step 3: Try JSON-LD extraction (same as GET)
     console.log('[Debug API] Step 3: Attempting JSON-LD extraction...');
-    const $ = cheerio.load(cleaned.html);
     let jsonLdResult = null;
 
     try {
-      const scripts = $('script[type="application/ld+json"]');
-      for (let i = 0; i < scripts.length; i++) {
-        const scriptContent = $(scripts[i]).html();
-        if (!scriptContent) continue;
-
-        const data = JSON.parse(scriptContent);
-        const items = Array.isArray(data) ? data : [data];
-
-        for (const item of items) {
-          if (
-            item['@type'] === 'Recipe' ||
-            (item['@graph'] &&
-              Array.isArray(item['@graph']) &&
-              item['@graph'].some((g: any) => g['@type'] === 'Recipe'))
-          ) {
-            const recipe =
-              item['@type'] === 'Recipe'
-                ? item
-                : item['@graph'].find((g: any) => g['@type'] === 'Recipe');
-
-            if (recipe && recipe.name && recipe.recipeIngredient && recipe.recipeInstructions) {
-              jsonLdResult = recipe;
-              break;
-            }
-          }
-        }
-        if (jsonLdResult) break;
-      }
+      // Same shared extractor as the main parser, fed by the scripts the cleaner collected
+      jsonLdResult =
+        findRecipeJsonLd(cleaned.jsonLd || []).find(
+          (recipe) => recipe.name && recipe.recipeIngredient && recipe.recipeInstructions
+        ) || null;
     } catch (error) {
       console.log('[Debug API] JSON-LD parsing failed:', error);
     }
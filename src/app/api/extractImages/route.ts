@@ -1,6 +1,9 @@
 import { NextRequest, NextResponse } from 'next/server';
 import * as cheerio from 'cheerio';
 
+// Maximum number of images returned per recipe
+const MAX_IMAGES = 3;
+
 /**
  * API endpoint to extract images from a recipe URL
  * Returns up to 3 recipe-related images
@@ -57,7 +60,15 @@ export async function POST(req: NextRequest): Promise<Response> {
     const $ = cheerio.load(html);
 
     // Extract images - prioritize recipe-related images
-    const images: string[] = [];
+    // Images are validated and de-duplicated as they are found, and collection
+    // stops as soon as MAX_IMAGES are in hand instead of walking every <img>
+    const images = new Set<string>();
+    const addImage = (imageUrl: unknown): boolean => {
+      if (typeof imageUrl === 'string' && isValidImageUrl(imageUrl)) {
+        images.add(imageUrl);
+      }
+      return images.size >= MAX_IMAGES;
+    };
 
     // 1. Try to find images in JSON-LD structured data (recipe images)
     $('script[type="application/ld+json"]').each((_, element) => {
@@ -74,17 +85,13 @@ export async function POST(req: NextRequest): Promise<Response> {
           if (item['@type'] === 'Recipe' || item['@type'] === 'ImageObject') {
             if (item.image) {
               if (typeof item.image === 'string') {
-                images.push(item.image);
+                if (addImage(item.image)) return false;
               } else if (item.image.url) {
-                images.push(item.image.url);
+                if (addImage(item.image.url)) return false;
               } else if (Array.isArray(item.image)) {
-                item.image.forEach((img: any) => {
-                  if (typeof img === 'string') {
-                    images.push(img);
-                  } else if (img.url) {
-                    images.push(img.url);
-                  }
-                });
+                for (const img of item.image) {
+                  if (addImage(typeof img === 'string' ? img : img?.url)) return false;
+                }
               }
             }
           }
@@ -105,15 +112,14 @@ export async function POST(req: NextRequest): Promise<Response> {
     ];
 
     for (const selector of imageSelectors) {
+      if (images.size >= MAX_IMAGES) break;
+
       $(selector).each((_, element) => {
         const src = $(element).attr('src') || $(element).attr('data-src');
-        if (src && !images.includes(src)) {
+        if (src) {
           // Convert relative URLs to absolute
           try {
-            const imageUrl = new URL(src, url).href;
-            if (isValidImageUrl(imageUrl)) {
-              images.push(imageUrl);
-            }
+            if (addImage(new URL(src, url).href)) return false;
           } catch {
             // Skip invalid URLs
           }
@@ -121,10 +127,7 @@ export async function POST(req: NextRequest): Promise<Response> {
       });
     }
 
-    // 3. Remove duplicates and filter out invalid images
-    const uniqueImages = Array.from(new Set(images))
-      .filter((img) => isValidImageUrl(img))
-      .slice(0, 3); // Limit to 3 images
+    const uniqueImages = Array.from(images);
 
     console.log(`[API /extractImages] Found ${uniqueImages.length} images`);
 
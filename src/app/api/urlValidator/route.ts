@@ -1,6 +1,6 @@
-import axios from 'axios';
 import * as cheerio from 'cheerio';
 import { formatError, ERROR_CODES } from '@/utils/formatError';
+import { fetchRecipePage, type FetchedPage } from '@/utils/fetchRecipePage';
 
 export async function POST(req: Request) {
   try {
@@ -27,16 +27,44 @@ export async function POST(req: Request) {
     // Note: Domain restriction removed - now supports any recipe website
     // The Python scraper will handle all domains with multi-layer fallback approach
 
-    const { data: html } = await axios.get(url, {
-      timeout: 10000,
-      headers: {
-        'User-Agent':
-          'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Accept-Language': 'en-US,en;q=0.9',
-        Accept:
-          'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-      },
-    });
+    // Fetch through the shared page cache so the recipe parse that follows a
+    // successful validation can reuse this download instead of fetching again
+    let page: FetchedPage;
+    try {
+      page = await fetchRecipePage(url);
+    } catch (error) {
+      console.error('URL validation error:', error);
+
+      if (
+        error instanceof Error &&
+        (error.name === 'AbortError' || error.message.includes('abort'))
+      ) {
+        return Response.json(
+          formatError(ERROR_CODES.ERR_TIMEOUT, 'Request timed out'),
+        );
+      }
+      return Response.json(
+        formatError(ERROR_CODES.ERR_FETCH_FAILED, 'Failed to fetch the page'),
+      );
+    }
+
+    if (!page.ok) {
+      if (page.status === 404) {
+        return Response.json(
+          formatError(ERROR_CODES.ERR_NO_RECIPE_FOUND, 'Page not found'),
+        );
+      }
+      if (page.status >= 500) {
+        return Response.json(
+          formatError(ERROR_CODES.ERR_FETCH_FAILED, 'Server error occurred'),
+        );
+      }
+      return Response.json(
+        formatError(ERROR_CODES.ERR_FETCH_FAILED, 'Failed to fetch the page'),
+      );
+    }
+
+    const html = page.html;
 
     // Validate that we received HTML content
     if (!html || typeof html !== 'string' || html.trim().length === 0) {
@@ -48,18 +76,26 @@ export async function POST(req: Request) {
       );
     }
 
-    const $ = cheerio.load(html);
-    const text = $.text().toLowerCase();
-
-    const hasIngredients = text.includes('ingredient');
-    const hasInstructions =
-      text.includes('instruction') ||
-      text.includes('step') ||
-      text.includes('directions');
+    // Check for schema.org Recipe markup first - it's a plain string scan and
+    // most recipe sites emit it, so we can skip building a DOM entirely
     const hasSchema =
       html.includes('"@type":"Recipe"') || html.includes('@type": "Recipe"');
 
-    const isRecipe = (hasIngredients && hasInstructions) || hasSchema;
+    let isRecipe = hasSchema;
+
+    // Only fall back to scanning page text when there's no structured data
+    if (!isRecipe) {
+      const $ = cheerio.load(html);
+      const text = $.text().toLowerCase();
+
+      const hasIngredients = text.includes('ingredient');
+      const hasInstructions =
+        text.includes('instruction') ||
+        text.includes('step') ||
+        text.includes('directions');
+
+      isRecipe = hasIngredients && hasInstructions;
+    }
 
     if (!isRecipe) {
       return Response.json(
@@ -74,27 +110,6 @@ export async function POST(req: Request) {
   } catch (error) {
     console.error('URL validation error:', error);
 
-    if (axios.isAxiosError(error)) {
-      if (error.code === 'ECONNABORTED' || error.message.includes('timeout')) {
-        return Response.json(
-          formatError(ERROR_CODES.ERR_TIMEOUT, 'Request timed out'),
-        );
-      }
-      if (error.response?.status === 404) {
-        return Response.json(
-          formatError(ERROR_CODES.ERR_NO_RECIPE_FOUND, 'Page not found'),
-        );
-      }
-      if (error.response?.status && error.response.status >= 500) {
-        return Response.json(
-          formatError(ERROR_CODES.ERR_FETCH_FAILED, 'Server error occurred'),
-        );
-      }
-      return Response.json(
-        formatError(ERROR_CODES.ERR_FETCH_FAILED, 'Failed to fetch the page'),
-      );
-    }
-
     return Response.json(
       formatError(ERROR_CODES.ERR_UNKNOWN, 'An unexpected error occurred'),
     );
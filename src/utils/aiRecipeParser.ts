@@ -8,9 +8,9 @@
  * This approach works with any recipe website without requiring site-specific selectors.
  */
 
-import * as cheerio from 'cheerio';
 import Groq from 'groq-sdk';
 import { cleanRecipeHTML } from './htmlCleaner';
+import { fetchRecipePage } from './fetchRecipePage';
 import { SUPPORTED_CUISINES, isSupportedCuisine } from '@/config/cuisineConfig';
 
 // Derive a concise, human-friendly title from an instruction detail
@@ -159,303 +159,339 @@ function parseISODuration(duration: string): number | undefined {
   return totalMinutes > 0 ? totalMinutes : undefined;
 }
 
+// Verbose parser tracing. A single parse emits dozens of lines, so outside of local
+// development it only runs when DEBUG_RECIPE_PARSER=true. debugLog() skips console
+// output and formatting, but its arguments are still evaluated, so call sites that
+// build summary objects, long template strings or substrings check the flag directly
+// instead. Errors always go to console.error.
+const DEBUG_RECIPE_PARSER =
+  process.env.DEBUG_RECIPE_PARSER === 'true' || process.env.NODE_ENV === 'development';
+
+function debugLog(...args: unknown[]): void {
+  if (DEBUG_RECIPE_PARSER) console.log(...args);
+}
+
+// Patterns used when cleaning JSON-LD data, compiled once at module load
+// instead of on every recipe that gets parsed
+const DOUBLE_OPEN_PAREN_RE = /\(\(/g;
+const DOUBLE_CLOSE_PAREN_RE = /\)\)/g;
+const COOKING_TERMS_RE =
+  /(heat|add|stir|mix|cook|bake|simmer|boil|fry|roast|season|taste|serve|preheat|chop|dice|slice|mince|pour|drain|whisk|beat|fold|knead|roll|cut|peel|grate|zest|squeeze|melt|saute|brown|caramelize|deglaze|reduce|thicken|thaw|marinate|brine|rub|glaze|garnish|top|sprinkle|drizzle|toss|coat|dredge|flour|bread|batter|crust|filling|topping|sauce|gravy|broth|stock|marinade|dressing|vinaigrette|seasoning|spice|herb|aromatic|flavor|taste|texture|tender|crispy|golden|browned|caramelized|caramel|syrup|honey|sugar|salt|pepper|garlic|onion|herbs|spices)/i;
+const PERSON_NAME_RE = /^[A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,2}\.?$/;
+const BYLINE_RE = /^by\s+[A-Z]/i;
+const LINE_BREAKS_RE = /\n+/;
+
 /**
- * Extract recipe data from JSON-LD structured data (Layer 1 - Fast Path)
- * This is the most reliable method when available and doesn't use AI tokens
+ * Normalize double parentheses to single parentheses (some sites have ((...)) in their JSON-LD)
  */
-function extractFromJsonLd($: cheerio.CheerioAPI): ParsedRecipe | null {
-  try {
-    const scripts = $('script[type="application/ld+json"]');
+function normalizeDoubleParens(text: string): string {
+  return text.replace(DOUBLE_OPEN_PAREN_RE, '(').replace(DOUBLE_CLOSE_PAREN_RE, ')');
+}
 
-    for (let i = 0; i < scripts.length; i++) {
-      try {
-        const scriptContent = $(scripts[i]).html();
-        if (!scriptContent) continue;
+/**
+ * Check if an instruction string looks like an author name rather than a step
+ */
+function isAuthorName(text: string): boolean {
+  if (!text || text.length === 0) return true;
 
-        const data = JSON.parse(scriptContent);
+  // If it's 1-3 capitalized words and has no cooking terms, it's likely an author name.
+  // The anchored name pattern already caps the text at 3 words and bails out within the
+  // first word or two of a real step, so it runs before the long cooking-terms scan.
+  if (PERSON_NAME_RE.test(text) && !COOKING_TERMS_RE.test(text)) return true;
 
-        // Handle both single objects and arrays of objects
-        const items = Array.isArray(data) ? data : [data];
+  // Check for "By [Name]" pattern
+  if (BYLINE_RE.test(text)) return true;
 
-        for (const item of items) {
-          // Check if @type is Recipe (handle both string and array formats)
-          const itemType = item['@type'];
-          const isRecipeType = 
-            itemType === 'Recipe' ||
-            (Array.isArray(itemType) && itemType.includes('Recipe'));
-          
-          // Look for Recipe type or items with recipe data
-          if (
-            isRecipeType ||
-            (item['@graph'] &&
-              Array.isArray(item['@graph']) &&
-              item['@graph'].some((g: any) => {
-                const gType = g['@type'];
-                return gType === 'Recipe' || (Array.isArray(gType) && gType.includes('Recipe'));
-              }))
-          ) {
-            // If it's in @graph, find the Recipe object
-            const recipe = isRecipeType
-              ? item
-              : item['@graph'].find((g: any) => {
-                  const gType = g['@type'];
-                  return gType === 'Recipe' || (Array.isArray(gType) && gType.includes('Recipe'));
-                });
+  return false;
+}
 
-            if (!recipe) continue;
+/**
+ * Check whether a JSON-LD node's @type is Recipe (handles both string and array formats)
+ */
+function isRecipeNode(node: any): boolean {
+  const nodeType = node?.['@type'];
+  return nodeType === 'Recipe' || (Array.isArray(nodeType) && nodeType.includes('Recipe'));
+}
 
-            const title = recipe.name || '';
+/**
+ * Collect Recipe nodes from a parsed JSON-LD value, walking arrays and @graph containers
+ */
+function collectRecipeNodes(value: any, recipes: any[]): void {
+  if (Array.isArray(value)) {
+    value.forEach((item) => collectRecipeNodes(item, recipes));
+    return;
+  }
+  if (!value || typeof value !== 'object') return;
 
-            // Normalize double parentheses to single parentheses (some sites have ((...)) in their JSON-LD)
-            const normalizeDoubleParens = (text: string): string => {
-              return text.replace(/\(\(/g, '(').replace(/\)\)/g, ')');
-            };
+  if (isRecipeNode(value)) {
+    recipes.push(value);
+  } else if (value['@graph']) {
+    collectRecipeNodes(value['@graph'], recipes);
+  }
+}
 
-            // Extract ingredients as simple strings first
-            const ingredientStrings: string[] = Array.isArray(
-              recipe.recipeIngredient
-            )
-              ? recipe.recipeIngredient.filter(
-                  (ing: any) => typeof ing === 'string' && ing.trim()
-                )
-              : [];
-
-            // Convert to structured format with default group
-            const ingredients: IngredientGroup[] = [
-              {
-                groupName: 'Main',
-                ingredients: ingredientStrings.map((ing) => ({
-                  amount: '',
-                  units: '',
-                  ingredient: normalizeDoubleParens(ing),
-                })),
-              },
-            ];
+/**
+ * Find all schema.org Recipe objects in a page's JSON-LD scripts
+ *
+ * Each script is parsed at most once, and scripts that never mention "Recipe" are not
+ * parsed at all (large Organization/WebSite/BreadcrumbList blocks are common).
+ * Handles single objects, top-level arrays and (nested) @graph containers.
+ * Scripts with invalid JSON are skipped.
+ *
+ * @param scripts - Contents of the page's <script type="application/ld+json"> tags
+ * @returns Recipe objects in document order
+ */
+export function findRecipeJsonLd(scripts: string[]): any[] {
+  const recipes: any[] = [];
 
-            let instructions: string[] = [];
+  for (const script of scripts) {
+    // A Recipe node needs "Recipe" in its @type, so skip the parse when it can't be there
+    if (!script.includes('Recipe')) continue;
 
-            // Helper function to check if text looks like an author name
-            const isAuthorName = (text: string): boolean => {
-              if (!text || text.length === 0) return true;
+    try {
+      collectRecipeNodes(JSON.parse(script), recipes);
+    } catch {
+      // Skip invalid JSON
+    }
+  }
 
-              const wordCount = text.split(/\s+/).length;
-              const hasCookingTerms =
-                /(heat|add|stir|mix|cook|bake|simmer|boil|fry|roast|season|taste|serve|preheat|chop|dice|slice|mince|pour|drain|whisk|beat|fold|knead|roll|cut|peel|grate|zest|squeeze|melt|saute|brown|caramelize|deglaze|reduce|thicken|thaw|marinate|brine|rub|glaze|garnish|top|sprinkle|drizzle|toss|coat|dredge|flour|bread|batter|crust|filling|topping|sauce|gravy|broth|stock|marinade|dressing|vinaigrette|seasoning|spice|herb|aromatic|flavor|taste|texture|tender|crispy|golden|browned|caramelized|caramel|syrup|honey|sugar|salt|pepper|garlic|onion|herbs|spices)/i.test(
-                  text
-                );
+  return recipes;
+}
 
-              // If it's 1-3 words and has no cooking terms, it's likely an author name
-              if (wordCount <= 3 && !hasCookingTerms) {
-                const looksLikeName =
-                  /^[A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,2}\.?$/.test(text);
-                if (looksLikeName) return true;
-              }
+/**
+ * Extract recipe data from JSON-LD structured data (Layer 1 - Fast Path)
+ * This is the most reliable method when available and doesn't use AI tokens
+ *
+ * @param scripts - Contents of the page's JSON-LD scripts (collected by the HTML cleaner)
+ */
+function extractFromJsonLd(scripts: string[]): ParsedRecipe | null {
+  try {
+    // The mapping below only reads fields defensively, so there is no per-recipe
+    // try/catch; anything unexpected is handled by the outer catch
+    for (const recipe of findRecipeJsonLd(scripts)) {
+      const title = recipe.name || '';
+
+      // Extract ingredients as simple strings first
+      const ingredientStrings: string[] = Array.isArray(
+        recipe.recipeIngredient
+      )
+        ? recipe.recipeIngredient.filter(
+            (ing: any) => typeof ing === 'string' && ing.trim()
+          )
+        : [];
 
-              // Check for "By [Name]" pattern
-              if (/^by\s+[A-Z]/i.test(text)) return true;
+      // Convert to structured format with default group
+      const ingredients: IngredientGroup[] = [
+        {
+          groupName: 'Main',
+          ingredients: ingredientStrings.map((ing) => ({
+            amount: '',
+            units: '',
+            ingredient: normalizeDoubleParens(ing),
+          })),
+        },
+      ];
 
-              return false;
-            };
+      let instructions: string[] = [];
 
-            // Handle different instruction formats
-            if (Array.isArray(recipe.recipeInstructions)) {
-              instructions = recipe.recipeInstructions
-                .map((inst: any) => {
-                  // Handle string format
-                  if (typeof inst === 'string') return normalizeDoubleParens(inst.trim());
-
-                  // Handle object with text property
-                  if (inst.text && typeof inst.text === 'string')
-                    return normalizeDoubleParens(inst.text.trim());
-
-                  // Handle HowToStep format
-                  if (
-                    inst['@type'] === 'HowToStep' &&
-                    inst.text &&
-                    typeof inst.text === 'string'
-                  )
-                    return normalizeDoubleParens(inst.text.trim());
-
-                  // Handle HowToStep with name property
-                  if (
-                    inst['@type'] === 'HowToStep' &&
-                    inst.name &&
-                    typeof inst.name === 'string'
-                  )
-                    return normalizeDoubleParens(inst.name.trim());
-
-                  // Handle itemListElement format
-                  if (
-                    inst.itemListElement &&
-                    Array.isArray(inst.itemListElement)
-                  ) {
-                    return normalizeDoubleParens(
-                      inst.itemListElement
-                        .map((item: any) => {
-                          if (item.text) return item.text.trim();
-                          if (item.name) return item.name.trim();
-                          return '';
-                        })
-                        .filter((t: string) => t.length > 0)
-                        .join(' ')
-                    );
-                  }
-
-                  return '';
-                })
-                .filter((text: string) => text.length > 10 && !isAuthorName(text));
-            } else if (
-              typeof recipe.recipeInstructions === 'string' &&
-              recipe.recipeInstructions.trim()
-            ) {
-              // Split string instructions by newlines
-              instructions = recipe.recipeInstructions
-                .split(/\n+/)
-                .map((s: string) => normalizeDoubleParens(s.trim()))
-                .filter((s: string) => s.length > 10 && !isAuthorName(s));
-            }
+      // Handle different instruction formats
+      if (Array.isArray(recipe.recipeInstructions)) {
+        instructions = recipe.recipeInstructions
+          .map((inst: any) => {
+            // Skip null/empty entries
+            if (!inst) return '';
 
-            // Extract author if available - handle various formats
-            let author: string | undefined = undefined;
-            
-            // Try different author field formats
-            if (recipe.author) {
-              if (typeof recipe.author === 'string') {
-                author = recipe.author.trim();
-              } else if (typeof recipe.author === 'object' && recipe.author !== null) {
-                // Handle author as object (e.g., {"@type": "Person", "name": "John Doe"})
-                if (recipe.author.name && typeof recipe.author.name === 'string') {
-                  author = recipe.author.name.trim();
-                }
-              }
-            }
-            
-            // Try publisher as fallback
-            if (!author && recipe.publisher) {
-              if (typeof recipe.publisher === 'string') {
-                author = recipe.publisher.trim();
-              } else if (typeof recipe.publisher === 'object' && recipe.publisher !== null) {
-                if (recipe.publisher.name && typeof recipe.publisher.name === 'string') {
-                  author = recipe.publisher.name.trim();
-                }
-              }
-            }
-            
-            // Try creator as another fallback
-            if (!author && recipe.creator) {
-              if (typeof recipe.creator === 'string') {
-                author = recipe.creator.trim();
-              } else if (Array.isArray(recipe.creator) && recipe.creator.length > 0) {
-                const firstCreator = recipe.creator[0];
-                if (typeof firstCreator === 'string') {
-                  author = firstCreator.trim();
-                } else if (typeof firstCreator === 'object' && firstCreator !== null && firstCreator.name) {
-                  author = firstCreator.name.trim();
-                }
-              } else if (typeof recipe.creator === 'object' && recipe.creator !== null) {
-                if (recipe.creator.name && typeof recipe.creator.name === 'string') {
-                  author = recipe.creator.name.trim();
-                }
-              }
-            }
-            
-            // Only set author if it's a non-empty string
-            if (author && author.length === 0) {
-              author = undefined;
-            }
+            // Handle string format
+            if (typeof inst === 'string') return normalizeDoubleParens(inst.trim());
 
-            // Extract servings/yield from JSON-LD
-            // JSON-LD can have yield as a string (e.g., "4 servings") or number (e.g., 4)
-            let servings: number | undefined = undefined;
-            if (recipe.yield || recipe.recipeYield) {
-              const yieldValue = recipe.yield || recipe.recipeYield;
-              
-              // Handle string format like "4 servings" or "4"
-              if (typeof yieldValue === 'string') {
-                // Extract number from string (e.g., "4 servings" -> 4, "Serves 6" -> 6)
-                const numberMatch = yieldValue.match(/\d+/);
-                if (numberMatch) {
-                  servings = parseInt(numberMatch[0], 10);
-                }
-              } 
-              // Handle number format
-              else if (typeof yieldValue === 'number') {
-                servings = yieldValue;
-              }
-              // Handle array format (some sites use ["4 servings"])
-              else if (Array.isArray(yieldValue) && yieldValue.length > 0) {
-                const firstValue = yieldValue[0];
-                if (typeof firstValue === 'string') {
-                  const numberMatch = firstValue.match(/\d+/);
-                  if (numberMatch) {
-                    servings = parseInt(numberMatch[0], 10);
-                  }
-                } else if (typeof firstValue === 'number') {
-                  servings = firstValue;
-                }
-              }
-              
-            // Validate servings is a positive number
-            if (servings && (isNaN(servings) || servings <= 0)) {
-              servings = undefined;
-            }
-            }
+            // Handle object with text property
+            if (inst.text && typeof inst.text === 'string')
+              return normalizeDoubleParens(inst.text.trim());
 
-            // Extract prep time, cook time, and total time from JSON-LD
-            // These are typically in ISO 8601 duration format (e.g., "PT30M", "PT1H30M")
-            let prepTimeMinutes: number | undefined = undefined;
-            let cookTimeMinutes: number | undefined = undefined;
-            let totalTimeMinutes: number | undefined = undefined;
-            
-            // Extract prepTime (prepTime or prepTimeMinutes)
-            if (recipe.prepTime) {
-              prepTimeMinutes = parseISODuration(recipe.prepTime);
-            } else if (typeof recipe.prepTimeMinutes === 'number' && recipe.prepTimeMinutes > 0) {
-              prepTimeMinutes = recipe.prepTimeMinutes;
-            }
-            
-            // Extract cookTime (cookTime or cookTimeMinutes)
-            if (recipe.cookTime) {
-              cookTimeMinutes = parseISODuration(recipe.cookTime);
-            } else if (typeof recipe.cookTimeMinutes === 'number' && recipe.cookTimeMinutes > 0) {
-              cookTimeMinutes = recipe.cookTimeMinutes;
-            }
-            
-            // Extract totalTime (totalTime or totalTimeMinutes)
-            if (recipe.totalTime) {
-              totalTimeMinutes = parseISODuration(recipe.totalTime);
-            } else if (typeof recipe.totalTimeMinutes === 'number' && recipe.totalTimeMinutes > 0) {
-              totalTimeMinutes = recipe.totalTimeMinutes;
-            }
+            // Handle HowToStep format
+            if (
+              inst['@type'] === 'HowToStep' &&
+              inst.text &&
+              typeof inst.text === 'string'
+            )
+              return normalizeDoubleParens(inst.text.trim());
 
-            const normalizedInstructions = normalizeInstructionSteps(instructions);
+            // Handle HowToStep with name property
+            if (
+              inst['@type'] === 'HowToStep' &&
+              inst.name &&
+              typeof inst.name === 'string'
+            )
+              return normalizeDoubleParens(inst.name.trim());
 
-            // Validate we have complete data
+            // Handle itemListElement format
             if (
-              title &&
-              title.length > 3 &&
-              ingredients[0].ingredients.length > 0 &&
-              normalizedInstructions.length > 0
+              inst.itemListElement &&
+              Array.isArray(inst.itemListElement)
             ) {
-              console.log(
-                `[JSON-LD] Found recipe: "${title}" with ${ingredients[0].ingredients.length} ingredients and ${normalizedInstructions.length} instructions${author ? `, author: "${author}"` : ''}${servings ? `, servings: ${servings}` : ''}${prepTimeMinutes ? `, prepTime: ${prepTimeMinutes}min` : ''}${cookTimeMinutes ? `, cookTime: ${cookTimeMinutes}min` : ''}${totalTimeMinutes ? `, totalTime: ${totalTimeMinutes}min` : ''}`
+              return normalizeDoubleParens(
+                inst.itemListElement
+                  .map((item: any) => {
+                    if (typeof item?.text === 'string') return item.text.trim();
+                    if (typeof item?.name === 'string') return item.name.trim();
+                    return '';
+                  })
+                  .filter((t: string) => t.length > 0)
+                  .join(' ')
               );
-              return { 
-                title, 
-                ingredients, 
-                instructions: normalizedInstructions, 
-                author,
-                ...(servings && { servings }),
-                ...(prepTimeMinutes && { prepTimeMinutes }),
-                ...(cookTimeMinutes && { cookTimeMinutes }),
-                ...(totalTimeMinutes && { totalTimeMinutes })
-              };
             }
+
+            return '';
+          })
+          .filter((text: string) => text.length > 10 && !isAuthorName(text));
+      } else if (
+        typeof recipe.recipeInstructions === 'string' &&
+        recipe.recipeInstructions.trim()
+      ) {
+        // Split string instructions by newlines
+        instructions = recipe.recipeInstructions
+          .split(LINE_BREAKS_RE)
+          .map((s: string) => normalizeDoubleParens(s.trim()))
+          .filter((s: string) => s.length > 10 && !isAuthorName(s));
+      }
+
+      // Extract author if available - handle various formats
+      let author: string | undefined = undefined;
+      
+      // Try different author field formats
+      if (recipe.author) {
+        if (typeof recipe.author === 'string') {
+          author = recipe.author.trim();
+        } else if (typeof recipe.author === 'object' && recipe.author !== null) {
+          // Handle author as object (e.g., {"@type": "Person", "name": "John Doe"})
+          if (recipe.author.name && typeof recipe.author.name === 'string') {
+            author = recipe.author.name.trim();
+          }
+        }
+      }
+      
+      // Try publisher as fallback
+      if (!author && recipe.publisher) {
+        if (typeof recipe.publisher === 'string') {
+          author = recipe.publisher.trim();
+        } else if (typeof recipe.publisher === 'object' && recipe.publisher !== null) {
+          if (recipe.publisher.name && typeof recipe.publisher.name === 'string') {
+            author = recipe.publisher.name.trim();
+          }
+        }
+      }
+      
+      // Try creator as another fallback
+      if (!author && recipe.creator) {
+        if (typeof recipe.creator === 'string') {
+          author = recipe.creator.trim();
+        } else if (Array.isArray(recipe.creator) && recipe.creator.length > 0) {
+          const firstCreator = recipe.creator[0];
+          if (typeof firstCreator === 'string') {
+            author = firstCreator.trim();
+          } else if (typeof firstCreator === 'object' && firstCreator !== null && typeof firstCreator.name === 'string') {
+            author = firstCreator.name.trim();
+          }
+        } else if (typeof recipe.creator === 'object' && recipe.creator !== null) {
+          if (recipe.creator.name && typeof recipe.creator.name === 'string') {
+            author = recipe.creator.name.trim();
           }
         }
-      } catch (e) {
-        // Continue to next script tag if this one fails
-        continue;
+      }
+      
+      // Only set author if it's a non-empty string
+      if (author && author.length === 0) {
+        author = undefined;
+      }
+
+      // Extract servings/yield from JSON-LD
+      // JSON-LD can have yield as a string (e.g., "4 servings") or number (e.g., 4)
+      let servings: number | undefined = undefined;
+      if (recipe.yield || recipe.recipeYield) {
+        const yieldValue = recipe.yield || recipe.recipeYield;
+        
+        // Handle string format like "4 servings" or "4"
+        if (typeof yieldValue === 'string') {
+          // Extract number from string (e.g., "4 servings" -> 4, "Serves 6" -> 6)
+          const numberMatch = yieldValue.match(/\d+/);
+          if (numberMatch) {
+            servings = parseInt(numberMatch[0], 10);
+          }
+        } 
+        // Handle number format
+        else if (typeof yieldValue === 'number') {
+          servings = yieldValue;
+        }
+        // Handle array format (some sites use ["4 servings"])
+        else if (Array.isArray(yieldValue) && yieldValue.length > 0) {
+          const firstValue = yieldValue[0];
+          if (typeof firstValue === 'string') {
+            const numberMatch = firstValue.match(/\d+/);
+            if (numberMatch) {
+              servings = parseInt(numberMatch[0], 10);
+            }
+          } else if (typeof firstValue === 'number') {
+            servings = firstValue;
+          }
+        }
+        
+      // Validate servings is a positive number
+      if (servings && (isNaN(servings) || servings <= 0)) {
+        servings = undefined;
+      }
+      }
+
+      // Extract prep time, cook time, and total time from JSON-LD
+      // These are typically in ISO 8601 duration format (e.g., "PT30M", "PT1H30M")
+      let prepTimeMinutes: number | undefined = undefined;
+      let cookTimeMinutes: number | undefined = undefined;
+      let totalTimeMinutes: number | undefined = undefined;
+      
+      // Extract prepTime (prepTime or prepTimeMinutes)
+      if (recipe.prepTime) {
+        prepTimeMinutes = parseISODuration(recipe.prepTime);
+      } else if (typeof recipe.prepTimeMinutes === 'number' && recipe.prepTimeMinutes > 0) {
+        prepTimeMinutes = recipe.prepTimeMinutes;
+      }
+      
+      // Extract cookTime (cookTime or cookTimeMinutes)
+      if (recipe.cookTime) {
+        cookTimeMinutes = parseISODuration(recipe.cookTime);
+      } else if (typeof recipe.cookTimeMinutes === 'number' && recipe.cookTimeMinutes > 0) {
+        cookTimeMinutes = recipe.cookTimeMinutes;
+      }
+      
+      // Extract totalTime (totalTime or totalTimeMinutes)
+      if (recipe.totalTime) {
+        totalTimeMinutes = parseISODuration(recipe.totalTime);
+      } else if (typeof recipe.totalTimeMinutes === 'number' && recipe.totalTimeMinutes > 0) {
+        totalTimeMinutes = recipe.totalTimeMinutes;
+      }
+
+      const normalizedInstructions = normalizeInstructionSteps(instructions);
+
+      // Validate we have complete data
+      if (
+        title &&
+        title.length > 3 &&
+        ingredients[0].ingredients.length > 0 &&
+        normalizedInstructions.length > 0
+      ) {
+        if (DEBUG_RECIPE_PARSER) {
+          console.log(
+            `[JSON-LD] Found recipe: "${title}" with ${ingredients[0].ingredients.length} ingredients and ${normalizedInstructions.length} instructions${author ? `, author: "${author}"` : ''}${servings ? `, servings: ${servings}` : ''}${prepTimeMinutes ? `, prepTime: ${prepTimeMinutes}min` : ''}${cookTimeMinutes ? `, cookTime: ${cookTimeMinutes}min` : ''}${totalTimeMinutes ? `, totalTime: ${totalTimeMinutes}min` : ''}`
+          );
+        }
+        return { 
+          title, 
+          ingredients, 
+          instructions: normalizedInstructions, 
+          author,
+          ...(servings && { servings }),
+          ...(prepTimeMinutes && { prepTimeMinutes }),
+          ...(cookTimeMinutes && { cookTimeMinutes }),
+          ...(totalTimeMinutes && { totalTimeMinutes })
+        };
       }
     }
   } catch (error) {
@@ -564,7 +600,7 @@ async function parseWithAI(cleanedHtml: string): Promise<ParsedRecipe | null> {
     // Limit HTML to prevent token overflow (keep first 15k characters)
     const limitedHtml = cleanedHtml.slice(0, 15000);
 
-    console.log('[AI Parser] Sending HTML to AI for parsing...');
+    debugLog('[AI Parser] Sending HTML to AI for parsing...');
 
     const response = await groq.chat.completions.create({
       model: 'llama-3.3-70b-versatile',
@@ -1150,7 +1186,7 @@ ABSOLUTE REQUIREMENTS:
 
     // Check if AI explicitly says no recipe found
     if (result.toLowerCase().includes('no recipe found')) {
-      console.log('[AI Parser] AI determined no recipe in content');
+      debugLog('[AI Parser] AI determined no recipe in content');
       return null;
     }
 
@@ -1195,7 +1231,7 @@ ABSOLUTE REQUIREMENTS:
       if (hasStringInstructions) {
         console.warn('[AI Parser] ⚠️ AI returned instructions as strings instead of objects. Prompt may need adjustment.');
       } else {
-        console.log('[AI Parser] ✅ AI correctly returned instructions as objects with title/detail');
+        debugLog('[AI Parser] ✅ AI correctly returned instructions as objects with title/detail');
       }
 
       const normalizedInstructions = normalizeInstructionSteps(
@@ -1203,9 +1239,11 @@ ABSOLUTE REQUIREMENTS:
       );
 
       if (validIngredients && normalizedInstructions.length > 0) {
-        console.log(
-          `[AI Parser] Successfully parsed recipe: "${parsedData.title}" with ${parsedData.ingredients.reduce((sum: number, g: any) => sum + g.ingredients.length, 0)} ingredients and ${normalizedInstructions.length} instructions`
-        );
+        if (DEBUG_RECIPE_PARSER) {
+          console.log(
+            `[AI Parser] Successfully parsed recipe: "${parsedData.title}" with ${parsedData.ingredients.reduce((sum: number, g: any) => sum + g.ingredients.length, 0)} ingredients and ${normalizedInstructions.length} instructions`
+          );
+        }
         // Return recipe with author, servings, and cuisine if available
         const recipe: ParsedRecipe = {
           title: parsedData.title,
@@ -1239,7 +1277,9 @@ ABSOLUTE REQUIREMENTS:
         // Extract storage guidance if provided by AI
         if (parsedData.storageGuide && typeof parsedData.storageGuide === 'string') {
           recipe.storageGuide = parsedData.storageGuide.trim();
-          console.log('[AI Parser] 📦 Storage guide extracted:', recipe.storageGuide.substring(0, 50) + '...');
+          if (DEBUG_RECIPE_PARSER) {
+            console.log('[AI Parser] 📦 Storage guide extracted:', recipe.storageGuide.substring(0, 50) + '...');
+          }
         }
         
         // Extract shelf life if provided by AI
@@ -1248,48 +1288,54 @@ ABSOLUTE REQUIREMENTS:
             fridge: typeof parsedData.shelfLife.fridge === 'number' ? parsedData.shelfLife.fridge : null,
             freezer: typeof parsedData.shelfLife.freezer === 'number' ? parsedData.shelfLife.freezer : null,
           };
-          console.log('[AI Parser] 📦 Shelf life extracted:', recipe.shelfLife);
+          debugLog('[AI Parser] 📦 Shelf life extracted:', recipe.shelfLife);
         }
         
         // Extract plating notes if provided by AI
         if (parsedData.platingNotes && typeof parsedData.platingNotes === 'string') {
           recipe.platingNotes = parsedData.platingNotes.trim();
-          console.log('[AI Parser] 🍽️ Plating notes extracted:', recipe.platingNotes.substring(0, 50) + '...');
+          if (DEBUG_RECIPE_PARSER) {
+            console.log('[AI Parser] 🍽️ Plating notes extracted:', recipe.platingNotes.substring(0, 50) + '...');
+          }
         }
         
         // Extract serving vessel if provided by AI
         if (parsedData.servingVessel && typeof parsedData.servingVessel === 'string') {
           recipe.servingVessel = parsedData.servingVessel.trim();
-          console.log('[AI Parser] 🍽️ Serving vessel extracted:', recipe.servingVessel);
+          debugLog('[AI Parser] 🍽️ Serving vessel extracted:', recipe.servingVessel);
         }
         
         // Extract serving temperature if provided by AI
         if (parsedData.servingTemp && typeof parsedData.servingTemp === 'string') {
           recipe.servingTemp = parsedData.servingTemp.trim();
-          console.log('[AI Parser] 🌡️ Serving temp extracted:', recipe.servingTemp);
+          debugLog('[AI Parser] 🌡️ Serving temp extracted:', recipe.servingTemp);
         }
         
         // Log important recipe output information: title, author, servings, storage, and plating
-        console.log('[AI Parser] 📋 Recipe output summary:', {
-          title: recipe.title || 'N/A',
-          author: recipe.author || 'N/A',
-          servings: recipe.servings || 'N/A',
-          hasAuthor: !!recipe.author,
-          hasServings: !!recipe.servings,
-          hasStorageGuide: !!recipe.storageGuide,
-          hasShelfLife: !!recipe.shelfLife,
-          hasPlatingNotes: !!recipe.platingNotes,
-          servingVessel: recipe.servingVessel || 'N/A',
-          servingTemp: recipe.servingTemp || 'N/A',
-        });
+        if (DEBUG_RECIPE_PARSER) {
+          console.log('[AI Parser] 📋 Recipe output summary:', {
+            title: recipe.title || 'N/A',
+            author: recipe.author || 'N/A',
+            servings: recipe.servings || 'N/A',
+            hasAuthor: !!recipe.author,
+            hasServings: !!recipe.servings,
+            hasStorageGuide: !!recipe.storageGuide,
+            hasShelfLife: !!recipe.shelfLife,
+            hasPlatingNotes: !!recipe.platingNotes,
+            servingVessel: recipe.servingVessel || 'N/A',
+            servingTemp: recipe.servingTemp || 'N/A',
+          });
+        }
         
         // Handle cuisine - normalize to array format and filter to supported cuisines only
-        console.log('[AI Parser] 🍽️ Starting cuisine detection for recipe:', parsedData.title);
-        console.log('[AI Parser] Raw cuisine data from AI:', {
-          cuisine: parsedData.cuisine,
-          type: typeof parsedData.cuisine,
-          isArray: Array.isArray(parsedData.cuisine),
-        });
+        debugLog('[AI Parser] 🍽️ Starting cuisine detection for recipe:', parsedData.title);
+        if (DEBUG_RECIPE_PARSER) {
+          console.log('[AI Parser] Raw cuisine data from AI:', {
+            cuisine: parsedData.cuisine,
+            type: typeof parsedData.cuisine,
+            isArray: Array.isArray(parsedData.cuisine),
+          });
+        }
         
         if (parsedData.cuisine) {
           if (Array.isArray(parsedData.cuisine)) {
@@ -1298,13 +1344,13 @@ ABSOLUTE REQUIREMENTS:
               .filter((c: any) => typeof c === 'string' && c.trim().length > 0)
               .map((c: string) => c.trim());
             
-            console.log('[AI Parser] Detected cuisines (array):', detectedCuisines);
+            debugLog('[AI Parser] Detected cuisines (array):', detectedCuisines);
             
             // Normalize cuisine names: try exact match first, then case-insensitive match
             const normalizeCuisineName = (name: string): string | null => {
               // Try exact match first
               if (isSupportedCuisine(name)) {
-                console.log(`[AI Parser] ✅ Exact match found: "${name}"`);
+                debugLog(`[AI Parser] ✅ Exact match found: "${name}"`);
                 return name;
               }
               // Try case-insensitive match
@@ -1313,10 +1359,10 @@ ABSOLUTE REQUIREMENTS:
                 (supported) => supported.toLowerCase() === lowerName
               );
               if (matched) {
-                console.log(`[AI Parser] ✅ Case-insensitive match: "${name}" → "${matched}"`);
+                debugLog(`[AI Parser] ✅ Case-insensitive match: "${name}" → "${matched}"`);
                 return matched;
               }
-              console.log(`[AI Parser] ❌ No match for: "${name}"`);
+              debugLog(`[AI Parser] ❌ No match for: "${name}"`);
               return null;
             };
             
@@ -1327,13 +1373,15 @@ ABSOLUTE REQUIREMENTS:
             
             if (validCuisines.length > 0) {
               recipe.cuisine = validCuisines;
-              console.log('[AI Parser] ✅ Cuisine detection SUCCESS:', {
-                title: recipe.title,
-                detectedCuisines,
-                validCuisines,
-                unsupportedCuisines: detectedCuisines.filter(c => !normalizeCuisineName(c)),
-                supportedCuisines: SUPPORTED_CUISINES,
-              });
+              if (DEBUG_RECIPE_PARSER) {
+                console.log('[AI Parser] ✅ Cuisine detection SUCCESS:', {
+                  title: recipe.title,
+                  detectedCuisines,
+                  validCuisines,
+                  unsupportedCuisines: detectedCuisines.filter(c => !normalizeCuisineName(c)),
+                  supportedCuisines: SUPPORTED_CUISINES,
+                });
+              }
             } else if (detectedCuisines.length > 0) {
               console.warn('[AI Parser] ⚠️ Cuisine detected but not supported:', {
                 title: recipe.title,
@@ -1342,18 +1390,18 @@ ABSOLUTE REQUIREMENTS:
                 reason: 'None of the detected cuisines match supported list (even with case-insensitive matching)',
               });
             } else {
-              console.log('[AI Parser] ⚠️ Cuisine array was empty or invalid');
+              debugLog('[AI Parser] ⚠️ Cuisine array was empty or invalid');
             }
           } else if (typeof parsedData.cuisine === 'string' && parsedData.cuisine.trim().length > 0) {
             // Handle single string cuisine
             const cuisineStr = parsedData.cuisine.trim();
-            console.log('[AI Parser] Detected single cuisine string:', cuisineStr);
+            debugLog('[AI Parser] Detected single cuisine string:', cuisineStr);
             
             // Try exact match first, then case-insensitive
             let normalizedCuisine: string | null = null;
             if (isSupportedCuisine(cuisineStr)) {
               normalizedCuisine = cuisineStr;
-              console.log(`[AI Parser] ✅ Exact match found: "${cuisineStr}"`);
+              debugLog(`[AI Parser] ✅ Exact match found: "${cuisineStr}"`);
             } else {
               const lowerName = cuisineStr.toLowerCase();
               const matched = SUPPORTED_CUISINES.find(
@@ -1361,19 +1409,21 @@ ABSOLUTE REQUIREMENTS:
               );
               normalizedCuisine = matched || null;
               if (matched) {
-                console.log(`[AI Parser] ✅ Case-insensitive match: "${cuisineStr}" → "${matched}"`);
+                debugLog(`[AI Parser] ✅ Case-insensitive match: "${cuisineStr}" → "${matched}"`);
               } else {
-                console.log(`[AI Parser] ❌ No match for: "${cuisineStr}"`);
+                debugLog(`[AI Parser] ❌ No match for: "${cuisineStr}"`);
               }
             }
             
             if (normalizedCuisine) {
               recipe.cuisine = [normalizedCuisine];
-              console.log('[AI Parser] ✅ Single cuisine string added:', {
-                title: recipe.title,
-                detectedCuisine: cuisineStr,
-                normalizedCuisine,
-              });
+              if (DEBUG_RECIPE_PARSER) {
+                console.log('[AI Parser] ✅ Single cuisine string added:', {
+                  title: recipe.title,
+                  detectedCuisine: cuisineStr,
+                  normalizedCuisine,
+                });
+              }
             } else {
               console.warn('[AI Parser] ⚠️ Single cuisine string not supported:', {
                 title: recipe.title,
@@ -1382,10 +1432,12 @@ ABSOLUTE REQUIREMENTS:
               });
             }
           } else {
-            console.log('[AI Parser] ⚠️ Cuisine field exists but is invalid type:', {
-              type: typeof parsedData.cuisine,
-              value: parsedData.cuisine,
-            });
+            if (DEBUG_RECIPE_PARSER) {
+              console.log('[AI Parser] ⚠️ Cuisine field exists but is invalid type:', {
+                type: typeof parsedData.cuisine,
+                value: parsedData.cuisine,
+              });
+            }
           }
         } else {
           console.warn('[AI Parser] ⚠️ No cuisine detected by AI:', {
@@ -1396,7 +1448,7 @@ ABSOLUTE REQUIREMENTS:
           });
         }
         
-        console.log('[AI Parser] Final recipe cuisine:', recipe.cuisine || 'none');
+        debugLog('[AI Parser] Final recipe cuisine:', recipe.cuisine || 'none');
         return recipe;
       }
     }
@@ -1456,14 +1508,15 @@ ABSOLUTE REQUIREMENTS:
  * Main parsing function - tries JSON-LD first, then AI fallback
  * 
  * @param rawHtml - Raw HTML from recipe page
+ * @param sourceUrl - URL the HTML was fetched from, lets the cleaner use site-specific selectors (optional)
  * @returns ParserResult with success status, data, error, and method used
  */
-export async function parseRecipe(rawHtml: string): Promise<ParserResult> {
+export async function parseRecipe(rawHtml: string, sourceUrl?: string): Promise<ParserResult> {
   try {
-    console.log('[Recipe Parser] Starting universal recipe parsing...');
+    debugLog('[Recipe Parser] Starting universal recipe parsing...');
 
     // Clean the HTML first
-    const cleaned = cleanRecipeHTML(rawHtml);
+    const cleaned = cleanRecipeHTML(rawHtml, sourceUrl);
     if (!cleaned.success || !cleaned.html) {
       return {
         success: false,
@@ -1472,20 +1525,22 @@ export async function parseRecipe(rawHtml: string): Promise<ParserResult> {
       };
     }
 
-    // Load cleaned HTML with Cheerio
-    const $ = cheerio.load(cleaned.html);
-
     // Layer 1: Try JSON-LD extraction (fast, no API cost)
-    console.log('[Recipe Parser] Attempting JSON-LD extraction...');
-    const jsonLdResult = extractFromJsonLd($);
+    // Uses the scripts the cleaner already pulled out, so the cleaned HTML isn't parsed again
+    debugLog('[Recipe Parser] Attempting JSON-LD extraction...');
+    const jsonLdResult = extractFromJsonLd(cleaned.jsonLd || []);
     if (jsonLdResult) {
       // Check if JSON-LD only has "Main" group - if so, try AI parsing for better groupings
       const hasOnlyMainGroup = jsonLdResult.ingredients.length === 1 && 
                                 jsonLdResult.ingredients[0].groupName === 'Main';
       
+      // AI parsing runs once here: its result supplies better ingredient groupings
+      // (when JSON-LD only has "Main") as well as cuisine tags for the merge below
+      let aiResult: ParsedRecipe | null = null;
+
       if (hasOnlyMainGroup) {
-        console.log('[Recipe Parser] JSON-LD has only "Main" group, trying AI parsing for better groupings...');
-        const aiResult = await parseWithAI(cleaned.html);
+        debugLog('[Recipe Parser] JSON-LD has only "Main" group, trying AI parsing for better groupings...');
+        aiResult = await parseWithAI(cleaned.html);
         
         if (aiResult && aiResult.ingredients.length > 0) {
           // Use AI-detected groupings if they exist and are better than "Main"
@@ -1523,21 +1578,23 @@ export async function parseRecipe(rawHtml: string): Promise<ParserResult> {
       
       // Always try AI parsing for cuisine detection, even if JSON-LD has good groupings
       // This ensures we get cuisine tags even when JSON-LD parsing succeeds
-      console.log('[Recipe Parser] JSON-LD succeeded, calling AI parsing for cuisine detection...');
-      let aiResult: ParsedRecipe | null = null;
-      try {
-        aiResult = await parseWithAI(cleaned.html);
-      } catch (error) {
-        console.error('[Recipe Parser] AI parsing for cuisine failed:', error);
-        // Continue without cuisine if AI fails
+      // (reuse the grouping attempt's result instead of sending the same HTML to the AI twice)
+      if (!hasOnlyMainGroup) {
+        debugLog('[Recipe Parser] JSON-LD succeeded, calling AI parsing for cuisine detection...');
+        try {
+          aiResult = await parseWithAI(cleaned.html);
+        } catch (error) {
+          console.error('[Recipe Parser] AI parsing for cuisine failed:', error);
+          // Continue without cuisine if AI fails
+        }
       }
       
       // Merge JSON-LD data with AI-detected cuisine and servings (and summary if available)
-      console.log('[Recipe Parser] 🔄 Merging JSON-LD + AI results for cuisine detection');
-      console.log('[Recipe Parser] JSON-LD result cuisine:', jsonLdResult.cuisine || 'none');
-      console.log('[Recipe Parser] AI result cuisine:', aiResult?.cuisine || 'none');
-      console.log('[Recipe Parser] JSON-LD result servings:', jsonLdResult.servings || 'none');
-      console.log('[Recipe Parser] AI result servings:', aiResult?.servings || 'none');
+      debugLog('[Recipe Parser] 🔄 Merging JSON-LD + AI results for cuisine detection');
+      debugLog('[Recipe Parser] JSON-LD result cuisine:', jsonLdResult.cuisine || 'none');
+      debugLog('[Recipe Parser] AI result cuisine:', aiResult?.cuisine || 'none');
+      debugLog('[Recipe Parser] JSON-LD result servings:', jsonLdResult.servings || 'none');
+      debugLog('[Recipe Parser] AI result servings:', aiResult?.servings || 'none');
       
       const mergedRecipe: ParsedRecipe = {
         ...jsonLdResult,
@@ -1550,16 +1607,18 @@ export async function parseRecipe(rawHtml: string): Promise<ParserResult> {
         ...(jsonLdResult.totalTimeMinutes ? { totalTimeMinutes: jsonLdResult.totalTimeMinutes } : (aiResult?.totalTimeMinutes ? { totalTimeMinutes: aiResult.totalTimeMinutes } : {})),
       };
       
-      console.log('[Recipe Parser] ✅ Final merged recipe cuisine:', mergedRecipe.cuisine || 'none');
+      debugLog('[Recipe Parser] ✅ Final merged recipe cuisine:', mergedRecipe.cuisine || 'none');
       
       // Log important recipe output information: title, author, and servings
-      console.log('[Recipe Parser] 📋 Merged recipe output summary:', {
-        title: mergedRecipe.title || 'N/A',
-        author: mergedRecipe.author || 'N/A',
-        servings: mergedRecipe.servings || 'N/A',
-        hasAuthor: !!mergedRecipe.author,
-        hasServings: !!mergedRecipe.servings,
-      });
+      if (DEBUG_RECIPE_PARSER) {
+        console.log('[Recipe Parser] 📋 Merged recipe output summary:', {
+          title: mergedRecipe.title || 'N/A',
+          author: mergedRecipe.author || 'N/A',
+          servings: mergedRecipe.servings || 'N/A',
+          hasAuthor: !!mergedRecipe.author,
+          hasServings: !!mergedRecipe.servings,
+        });
+      }
       
       const summary = await generateRecipeSummary(mergedRecipe);
       const recipeWithSummary = {
@@ -1573,31 +1632,37 @@ export async function parseRecipe(rawHtml: string): Promise<ParserResult> {
       };
     }
 
-    console.log('[Recipe Parser] JSON-LD not available, falling back to AI parsing...');
+    debugLog('[Recipe Parser] JSON-LD not available, falling back to AI parsing...');
 
     // Layer 2: AI parsing fallback
     const aiResult = await parseWithAI(cleaned.html);
     if (aiResult) {
       // Log when AI parsing succeeds, including whether we captured author metadata
-      console.log(
-        `[Recipe Parser] AI parsing succeeded${aiResult.author ? ` with author "${aiResult.author}"` : ' (no author found)'}`
-      );
+      if (DEBUG_RECIPE_PARSER) {
+        console.log(
+          `[Recipe Parser] AI parsing succeeded${aiResult.author ? ` with author "${aiResult.author}"` : ' (no author found)'}`
+        );
+      }
       // #region agent log
-      console.log('[DEBUG] AI-only parsing - cuisine check:', {
-        title: aiResult.title,
-        hasCuisine: !!aiResult.cuisine,
-        cuisine: aiResult.cuisine,
-      });
+      if (DEBUG_RECIPE_PARSER) {
+        console.log('[DEBUG] AI-only parsing - cuisine check:', {
+          title: aiResult.title,
+          hasCuisine: !!aiResult.cuisine,
+          cuisine: aiResult.cuisine,
+        });
+      }
       // #endregion
       
       // Log important recipe output information: title, author, and servings
-      console.log('[Recipe Parser] 📋 AI-only recipe output summary:', {
-        title: aiResult.title || 'N/A',
-        author: aiResult.author || 'N/A',
-        servings: aiResult.servings || 'N/A',
-        hasAuthor: !!aiResult.author,
-        hasServings: !!aiResult.servings,
-      });
+      if (DEBUG_RECIPE_PARSER) {
+        console.log('[Recipe Parser] 📋 AI-only recipe output summary:', {
+          title: aiResult.title || 'N/A',
+          author: aiResult.author || 'N/A',
+          servings: aiResult.servings || 'N/A',
+          hasAuthor: !!aiResult.author,
+          hasServings: !!aiResult.servings,
+        });
+      }
       
       // Generate summary for AI parsed recipe
       const summary = await generateRecipeSummary(aiResult);
@@ -1658,6 +1723,48 @@ export async function parseRecipe(rawHtml: string): Promise<ParserResult> {
   }
 }
 
+// Cache of successful URL parses. Module state survives across requests on a warm
+// serverless instance, so repeat parses of the same URL skip the fetch and AI calls.
+// Entries are stored as JSON strings so every caller gets its own copy of the result.
+const RECIPE_CACHE_TTL_MS = 24 * 60 * 60 * 1000; // 24 hours
+const RECIPE_CACHE_MAX_ENTRIES = 100;
+const recipeCache = new Map<string, { expiresAt: number; json: string }>();
+
+/**
+ * Look up a cached parse result for a URL (returns null if missing or expired)
+ */
+function getCachedRecipe(url: string): ParserResult | null {
+  const entry = recipeCache.get(url);
+  if (!entry) return null;
+
+  if (entry.expiresAt <= Date.now()) {
+    recipeCache.delete(url);
+    return null;
+  }
+
+  // Re-insert so the Map's insertion order tracks recency (oldest entry first)
+  recipeCache.delete(url);
+  recipeCache.set(url, entry);
+  return JSON.parse(entry.json) as ParserResult;
+}
+
+/**
+ * Cache a successful parse result for a URL, evicting the least recently used entries
+ */
+function setCachedRecipe(url: string, result: ParserResult): void {
+  recipeCache.delete(url);
+  recipeCache.set(url, {
+    expiresAt: Date.now() + RECIPE_CACHE_TTL_MS,
+    json: JSON.stringify(result),
+  });
+
+  while (recipeCache.size > RECIPE_CACHE_MAX_ENTRIES) {
+    const oldestUrl = recipeCache.keys().next().value;
+    if (oldestUrl === undefined) break;
+    recipeCache.delete(oldestUrl);
+  }
+}
+
 /**
  * Parse recipe from URL (fetches HTML first)
  * 
@@ -1666,38 +1773,30 @@ export async function parseRecipe(rawHtml: string): Promise<ParserResult> {
  */
 export async function parseRecipeFromUrl(url: string): Promise<ParserResult> {
   try {
-    console.log(`[Recipe Parser] Fetching recipe from URL: ${url}`);
-
-    // Fetch HTML with timeout and proper headers
-    const controller = new AbortController();
-    const timeoutId = setTimeout(() => controller.abort(), 10000);
-
-    console.log(`[Recipe Parser] Making fetch request to: ${url}`);
-    const response = await fetch(url, {
-      headers: {
-        'User-Agent':
-          'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36',
-        Accept:
-          'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-      },
-      signal: controller.signal,
-    });
+    // Return a cached result if this URL was parsed recently
+    const cached = getCachedRecipe(url);
+    if (cached) {
+      debugLog(`[Recipe Parser] Using cached result for URL: ${url}`);
+      return cached;
+    }
+
+    debugLog(`[Recipe Parser] Fetching recipe from URL: ${url}`);
 
-    clearTimeout(timeoutId);
-    console.log(`[Recipe Parser] Fetch response: ${response.status} ${response.statusText}, ok: ${response.ok}`);
+    // Fetch HTML (reuses the page if the URL validator just downloaded it)
+    const page = await fetchRecipePage(url);
+    debugLog(`[Recipe Parser] Fetch response: ${page.status} ${page.statusText}, ok: ${page.ok}`);
 
-    if (!response.ok) {
-      console.error(`[Recipe Parser] Response not ok: ${response.status} ${response.statusText}`);
+    if (!page.ok) {
+      console.error(`[Recipe Parser] Response not ok: ${page.status} ${page.statusText}`);
       return {
         success: false,
-        error: `Failed to fetch URL: ${response.status} ${response.statusText}`,
+        error: `Failed to fetch URL: ${page.status} ${page.statusText}`,
         method: 'none',
       };
     }
 
-    const html = await response.text();
-    console.log(`[Recipe Parser] HTML length: ${html.length}`);
+    const html = page.html;
+    debugLog(`[Recipe Parser] HTML length: ${html.length}`);
 
     if (!html || html.trim().length === 0) {
       console.error('[Recipe Parser] HTML content is empty');
@@ -1709,11 +1808,12 @@ export async function parseRecipeFromUrl(url: string): Promise<ParserResult> {
     }
 
     // Parse the fetched HTML
-    const result = await parseRecipe(html);
+    const result = await parseRecipe(html, url);
     
     // Add sourceUrl to the result if parsing was successful
     if (result.success && result.data) {
       result.data.sourceUrl = url;
+      setCachedRecipe(url, result);
     }
     
     return result;
@@ -1740,6 +1840,53 @@ export async function parseRecipeFromUrl(url: string): Promise<ParserResult> {
   }
 }
 
+/**
+ * Parse several recipe URLs concurrently
+ *
+ * Library entry point for batch jobs (scripts, imports); no API route calls it yet.
+ * Each distinct URL is fetched and parsed once, with up to `concurrency` of them in
+ * flight at a time, so a batch no longer pays the full network + AI latency per URL.
+ * Repeated URLs in the batch are parsed once; every repeat after the first gets its own
+ * copy of that result, so callers can mutate any slot without affecting the others.
+ *
+ * @param urls - Recipe URLs to fetch and parse
+ * @param concurrency - Maximum number of URLs processed at the same time (default 10)
+ * @returns ParserResults in the same order as `urls`
+ */
+export async function parseRecipesFromUrls(
+  urls: string[],
+  concurrency = 10,
+): Promise<ParserResult[]> {
+  // Parse each URL once; parallel duplicates would both miss the recipe cache
+  const uniqueUrls = Array.from(new Set(urls));
+  const resultsByUrl = new Map<string, ParserResult>();
+  let nextIndex = 0;
+
+  // Each worker keeps pulling the next unprocessed URL until the list is exhausted
+  // (parseRecipeFromUrl never throws, it reports failures in its result)
+  const worker = async (): Promise<void> => {
+    while (nextIndex < uniqueUrls.length) {
+      const url = uniqueUrls[nextIndex++];
+      resultsByUrl.set(url, await parseRecipeFromUrl(url));
+    }
+  };
+
+  // Guard against NaN/Infinity/fractional values, which would otherwise start no workers
+  const requestedWorkers = Number.isFinite(concurrency) ? Math.floor(concurrency) : 10;
+  const workerCount = Math.max(1, Math.min(requestedWorkers, uniqueUrls.length));
+  await Promise.all(Array.from({ length: workerCount }, worker));
+
+  const seen = new Set<string>();
+  return urls.map((url) => {
+    const result = resultsByUrl.get(url) as ParserResult;
+    if (!seen.has(url)) {
+      seen.add(url);
+      return result;
+    }
+    return structuredClone(result);
+  });
+}
+
 /**
  * Parse recipe from image using AI vision model
  * 
@@ -1751,7 +1898,7 @@ export async function parseRecipeFromUrl(url: string): Promise<ParserResult> {
  */
 export async function parseRecipeFromImage(imageBase64: string): Promise<ParserResult> {
   try {
-    console.log('[Recipe Parser] Starting recipe parsing from image...');
+    debugLog('[Recipe Parser] Starting recipe parsing from image...');
 
     // Check if Groq API key is configured
     if (!process.env.GROQ_API_KEY) {
@@ -1767,12 +1914,12 @@ export async function parseRecipeFromImage(imageBase64: string): Promise<ParserR
       apiKey: process.env.GROQ_API_KEY,
     });
 
-    console.log('[Image Parser] Sending image to AI vision model for parsing...');
+    debugLog('[Image Parser] Sending image to AI vision model for parsing...');
 
     // Use Groq's vision model to analyze the image
     // Using meta-llama/llama-4-scout-17b-16e-instruct (vision-capable model)
     const modelToUse = 'meta-llama/llama-4-scout-17b-16e-instruct';
-    console.log('[Image Parser] Using model:', modelToUse);
+    debugLog('[Image Parser] Using model:', modelToUse);
     
     const response = await groq.chat.completions.create({
       model: modelToUse,
@@ -1832,8 +1979,10 @@ Start your response with { and end with }`,
 
     const result = response.choices[0]?.message?.content;
 
-    console.log('[Image Parser] Raw AI response length:', result?.length);
-    console.log('[Image Parser] Raw AI response (first 1000 chars):', result?.substring(0, 1000));
+    debugLog('[Image Parser] Raw AI response length:', result?.length);
+    if (DEBUG_RECIPE_PARSER) {
+      console.log('[Image Parser] Raw AI response (first 1000 chars):', result?.substring(0, 1000));
+    }
 
     if (!result || result.trim().length === 0) {
       console.error('[Image Parser] No response from AI service');
@@ -1849,16 +1998,18 @@ Start your response with { and end with }`,
     const jsonMatch = result.match(/\{[\s\S]*\}/);
     const jsonString = jsonMatch ? jsonMatch[0] : result;
 
-    console.log('[Image Parser] Extracted JSON string (first 500 chars):', jsonString.substring(0, 500));
+    if (DEBUG_RECIPE_PARSER) {
+      console.log('[Image Parser] Extracted JSON string (first 500 chars):', jsonString.substring(0, 500));
+    }
 
     // Parse the JSON response
     let parsedData;
     try {
       parsedData = JSON.parse(jsonString);
-      console.log('[Image Parser] Successfully parsed JSON');
-      console.log('[Image Parser] Parsed title:', parsedData.title);
-      console.log('[Image Parser] Ingredients array length:', parsedData.ingredients?.length);
-      console.log('[Image Parser] Instructions array length:', parsedData.instructions?.length);
+      debugLog('[Image Parser] Successfully parsed JSON');
+      debugLog('[Image Parser] Parsed title:', parsedData.title);
+      debugLog('[Image Parser] Ingredients array length:', parsedData.ingredients?.length);
+      debugLog('[Image Parser] Instructions array length:', parsedData.instructions?.length);
     } catch (parseError) {
       console.error('[Image Parser] Failed to parse JSON:', parseError);
       console.error('[Image Parser] JSON string that failed:', jsonString);
@@ -1871,8 +2022,8 @@ Start your response with { and end with }`,
 
     // Check if AI explicitly says no recipe found AFTER parsing
     if (parsedData.title && parsedData.title.toLowerCase().includes('no recipe found')) {
-      console.log('[Image Parser] AI determined no recipe in image');
-      console.log('[Image Parser] Full AI response for debugging:', result);
+      debugLog('[Image Parser] AI determined no recipe in image');
+      debugLog('[Image Parser] Full AI response for debugging:', result);
       return {
         success: false,
         error: 'No recipe found in image - AI could not read recipe text',
@@ -1904,9 +2055,11 @@ Start your response with { and end with }`,
       );
 
       if (validIngredients && normalizedInstructions.length > 0) {
-        console.log(
-          `[Image Parser] Successfully parsed recipe: "${parsedData.title}" with ${parsedData.ingredients.reduce((sum: number, g: any) => sum + g.ingredients.length, 0)} ingredients and ${normalizedInstructions.length} instructions`
-        );
+        if (DEBUG_RECIPE_PARSER) {
+          console.log(
+            `[Image Parser] Successfully parsed recipe: "${parsedData.title}" with ${parsedData.ingredients.reduce((sum: number, g: any) => sum + g.ingredients.length, 0)} ingredients and ${normalizedInstructions.length} instructions`
+          );
+        }
         const recipe: ParsedRecipe = {
           ...parsedData,
           instructions: normalizedInstructions,
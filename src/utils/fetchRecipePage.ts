@@ -0,0 +1,117 @@
+/**
+ * Recipe Page Fetching
+ *
+ * Downloads recipe pages for the URL validator and the recipe parser, decoding them
+ * with the charset the page declares. Kept free of parser/AI imports so lightweight
+ * routes can fetch a page without pulling in the whole recipe parser.
+ */
+
+// Charset declarations in the Content-Type header and in an early <meta> tag
+const CONTENT_TYPE_CHARSET_RE = /charset=["']?([^;"'\s]+)/i;
+const META_CHARSET_RE = /<meta[^>]+charset=["']?([\w-]+)/i;
+
+/**
+ * Read a fetched page as text, decoding it with the charset the page declares
+ *
+ * `response.text()` always decodes as UTF-8, which garbles recipe pages served in
+ * other encodings (e.g. windows-1252). Instead, read the body once as bytes and decode
+ * it a single time using the Content-Type charset, or a <meta charset> in the first
+ * 1 KB of the document, falling back to UTF-8 for missing or unknown labels.
+ *
+ * @param response - Successful fetch response for an HTML page
+ * @returns Decoded HTML
+ */
+export async function readHtmlResponse(response: Response): Promise<string> {
+  const bytes = new Uint8Array(await response.arrayBuffer());
+
+  let charset = response.headers.get('content-type')?.match(CONTENT_TYPE_CHARSET_RE)?.[1];
+  if (!charset) {
+    // Charset names are ASCII, so a latin1 view of the first 1 KB is enough to find the tag
+    const head = new TextDecoder('latin1').decode(bytes.subarray(0, 1024));
+    charset = head.match(META_CHARSET_RE)?.[1];
+  }
+
+  try {
+    return new TextDecoder(charset || 'utf-8').decode(bytes);
+  } catch {
+    // Unknown charset label - fall back to UTF-8 like response.text() would
+    return new TextDecoder('utf-8').decode(bytes);
+  }
+}
+
+// Recently fetched pages, keyed by URL. The client validates a URL (/api/urlValidator)
+// right before parsing it (/api/parseRecipe). When both routes run in the same process
+// (e.g. `next start`), the parse reuses the validator's download; separately bundled
+// serverless functions each keep their own small cache.
+const PAGE_CACHE_TTL_MS = 5 * 60 * 1000; // 5 minutes
+const PAGE_CACHE_MAX_ENTRIES = 10;
+const pageCache = new Map<string, { expiresAt: number; html: string }>();
+
+/**
+ * Result of fetching a recipe page
+ */
+export interface FetchedPage {
+  ok: boolean;
+  status: number;
+  statusText: string;
+  html: string; // Decoded HTML (empty when the response was not ok)
+}
+
+/**
+ * Fetch a recipe page as decoded HTML, reusing a recent download of the same URL
+ *
+ * Only successful, non-empty pages are cached. Network errors are thrown to the caller;
+ * a request whose headers and body take longer than 10 seconds in total is aborted
+ * (thrown as an AbortError).
+ *
+ * @param url - Recipe URL to fetch
+ * @returns The response status and decoded HTML
+ */
+export async function fetchRecipePage(url: string): Promise<FetchedPage> {
+  const cached = pageCache.get(url);
+  if (cached && cached.expiresAt > Date.now()) {
+    return { ok: true, status: 200, statusText: 'OK', html: cached.html };
+  }
+  pageCache.delete(url);
+
+  // Fetch HTML with timeout and proper headers. The timer stays armed until the body
+  // has been read, so a slow body is aborted too, not just slow response headers.
+  const controller = new AbortController();
+  const timeoutId = setTimeout(() => controller.abort(), 10000);
+
+  let response: Response;
+  let html: string;
+  try {
+    response = await fetch(url, {
+      headers: {
+        'User-Agent':
+          'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36',
+        Accept:
+          'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+      },
+      signal: controller.signal,
+    });
+
+    if (!response.ok) {
+      return { ok: false, status: response.status, statusText: response.statusText, html: '' };
+    }
+
+    html = await readHtmlResponse(response);
+  } finally {
+    clearTimeout(timeoutId);
+  }
+
+  if (html.trim().length > 0) {
+    pageCache.set(url, { expiresAt: Date.now() + PAGE_CACHE_TTL_MS, html });
+
+    // Evict the oldest pages (Map iterates in insertion order)
+    while (pageCache.size > PAGE_CACHE_MAX_ENTRIES) {
+      const oldestUrl = pageCache.keys().next().value;
+      if (oldestUrl === undefined) break;
+      pageCache.delete(oldestUrl);
+    }
+  }
+
+  return { ok: true, status: response.status, statusText: response.statusText, html };
+}
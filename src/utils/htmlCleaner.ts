@@ -10,12 +10,271 @@
 
 import * as cheerio from 'cheerio';
 
+/**
+ * Load HTML into Cheerio using the htmlparser2 backend
+ *
+ * Cheerio defaults to parse5, a spec-complete but comparatively slow parser.
+ * Recipe pages are large (often 200-800 KB) and we only need selector lookups
+ * and text/html serialization, so the faster htmlparser2 backend is a better fit.
+ * htmlparser2 is forgiving and never throws on malformed markup.
+ *
+ * `encodeEntities: 'utf8'` keeps `.html()` output in plain UTF-8 like parse5 does.
+ * Without it the serializer turns every non-ASCII character into a numeric entity
+ * (`½` -> `&#xbd;`), which bloats the HTML we send to the AI and can leak entities
+ * into parsed ingredient text.
+ *
+ * @param html - The HTML content to load
+ * @returns Cheerio API bound to the parsed document
+ */
+export function loadHtml(html: string): cheerio.CheerioAPI {
+  // `xml: { xmlMode: false }` switches Cheerio to htmlparser2 in HTML mode
+  return cheerio.load(html, { xml: { xmlMode: false, encodeEntities: 'utf8' } });
+}
+
+/**
+ * Markup that never carries recipe content: comments, scripts, styles, noscript
+ * blocks and inline (non self-closing) SVG. Matched in a single left-to-right pass
+ * so that, e.g., a "<script>" inside a comment is consumed along with the comment.
+ */
+const IRRELEVANT_MARKUP_RE =
+  /<!--[\s\S]*?-->|<(script|style|noscript)\b([^>]*)>[\s\S]*?<\/\1\s*>|<svg\b(?:[^>]*[^/>])?>[\s\S]*?<\/svg\s*>/gi;
+
+/**
+ * Strip irrelevant markup from raw HTML before it is parsed
+ *
+ * Cheerio has no equivalent of a "parse only" filter, so every icon sprite, analytics
+ * script and stylesheet on the page would otherwise become DOM nodes that we build
+ * and then immediately remove. Dropping them up front keeps the parsed tree small.
+ * JSON-LD scripts are kept since they hold the structured recipe data.
+ *
+ * @param rawHtml - The raw HTML content from a recipe page
+ * @returns HTML with irrelevant blocks removed
+ */
+function stripIrrelevantMarkup(rawHtml: string): string {
+  return rawHtml.replace(
+    IRRELEVANT_MARKUP_RE,
+    (match: string, tagName?: string, attributes?: string) =>
+      tagName?.toLowerCase() === 'script' && /application\/ld\+json/i.test(attributes || '')
+        ? match
+        : '',
+  );
+}
+
+/**
+ * Selectors for locating the ingredients section, in priority order
+ * Added more flexible selectors for sites like Just One Cookbook
+ */
+const INGREDIENT_SECTION_SELECTORS = [
+  '[class*="ingredient"]',
+  '[id*="ingredient"]',
+  '[itemprop="recipeIngredient"]',
+  '[class*="ingredients-list"]',
+  '[id*="ingredients-list"]',
+  'ul.ingredients, ol.ingredients',
+  '.recipe-ingredients, #recipe-ingredients',
+  '[data-ingredients]',
+  // Just One Cookbook and similar sites
+  '.wprm-recipe-ingredients-container',
+  '.wprm-recipe-ingredient',
+  '[class*="wprm-recipe-ingredient"]',
+];
+
+/**
+ * Selectors for locating the directions/instructions section, in priority order
+ */
+const INSTRUCTION_SECTION_SELECTORS = [
+  '[class*="instruction"]',
+  '[class*="direction"]',
+  '[id*="instruction"]',
+  '[id*="direction"]',
+  '[itemprop="recipeInstructions"]',
+  '[class*="steps"]',
+  '[id*="steps"]',
+  '.recipe-instructions, #recipe-instructions',
+  '.recipe-directions, #recipe-directions',
+  '[data-instructions]',
+  'ol.instructions, ul.instructions',
+  // Just One Cookbook and similar sites
+  '.wprm-recipe-instructions-container',
+  '.wprm-recipe-instruction',
+  '[class*="wprm-recipe-instruction"]',
+];
+
+// Grouped versions for when priority doesn't matter (e.g. removing duplicates):
+// a comma-separated selector list is matched in a single tree walk
+const INGREDIENT_SECTION_SELECTOR_GROUP = INGREDIENT_SECTION_SELECTORS.join(', ');
+const INSTRUCTION_SECTION_SELECTOR_GROUP = INSTRUCTION_SECTION_SELECTORS.join(', ');
+
+/**
+ * Rewrite a selector so Cheerio stops at the first match of each alternative
+ * (e.g. "ul.a, ol.a" -> "ul.a:first, ol.a:first")
+ *
+ * Taking `.first()` of the result still yields the earliest match in document order,
+ * but the selector engine no longer collects every match on the page only for us
+ * to discard all but one.
+ */
+function toFirstMatchSelector(selector: string): string {
+  return selector
+    .split(',')
+    .map((part) => `${part.trim()}:first`)
+    .join(', ');
+}
+
+const TITLE_FIRST_MATCH_SELECTOR = toFirstMatchSelector(
+  'h1, .recipe-title, [class*="recipe-title"], [itemprop="name"]'
+);
+const INGREDIENT_SECTION_FIRST_MATCH_SELECTORS = INGREDIENT_SECTION_SELECTORS.map(toFirstMatchSelector);
+const INSTRUCTION_SECTION_FIRST_MATCH_SELECTORS = INSTRUCTION_SECTION_SELECTORS.map(toFirstMatchSelector);
+
+/**
+ * Interface for site-specific section selectors
+ */
+interface SiteSectionSelectors {
+  ingredients: string[];
+  instructions: string[];
+}
+
+/**
+ * Section selectors known to match on specific sites (keyed by hostname without "www.")
+ * These are tried before the generic lists, so known hosts usually resolve on the first
+ * query instead of walking the generic selectors in order.
+ */
+const SITE_SECTION_SELECTORS: Record<string, SiteSectionSelectors> = {
+  // WP Recipe Maker sites
+  'justonecookbook.com': {
+    ingredients: ['.wprm-recipe-ingredients-container'],
+    instructions: ['.wprm-recipe-instructions-container'],
+  },
+  'budgetbytes.com': {
+    ingredients: ['.wprm-recipe-ingredients-container'],
+    instructions: ['.wprm-recipe-instructions-container'],
+  },
+  'minimalistbaker.com': {
+    ingredients: ['.wprm-recipe-ingredients-container'],
+    instructions: ['.wprm-recipe-instructions-container'],
+  },
+  // Tasty Recipes sites
+  'pinchofyum.com': {
+    ingredients: ['.tasty-recipes-ingredients'],
+    instructions: ['.tasty-recipes-instructions'],
+  },
+};
+
+// Site-specific selectors followed by the generic ones, precomputed per host
+const SITE_SECTION_FIRST_MATCH_SELECTORS: Record<string, SiteSectionSelectors> =
+  Object.fromEntries(
+    Object.entries(SITE_SECTION_SELECTORS).map(([hostname, selectors]) => [
+      hostname,
+      {
+        ingredients: [
+          ...selectors.ingredients.map(toFirstMatchSelector),
+          ...INGREDIENT_SECTION_FIRST_MATCH_SELECTORS,
+        ],
+        instructions: [
+          ...selectors.instructions.map(toFirstMatchSelector),
+          ...INSTRUCTION_SECTION_FIRST_MATCH_SELECTORS,
+        ],
+      },
+    ])
+  );
+
+/**
+ * Get the section selectors to try for a page, site-specific ones first when the host is known
+ *
+ * @param sourceUrl - URL the HTML was fetched from (optional)
+ * @returns Ingredient and instruction selectors in priority order
+ */
+function getSectionSelectors(sourceUrl?: string): SiteSectionSelectors {
+  if (sourceUrl) {
+    try {
+      const hostname = new URL(sourceUrl).hostname.replace(/^www\./, '');
+      const siteSelectors = SITE_SECTION_FIRST_MATCH_SELECTORS[hostname];
+      if (siteSelectors) return siteSelectors;
+    } catch {
+      // Invalid URL - use the generic selectors
+    }
+  }
+
+  return {
+    ingredients: INGREDIENT_SECTION_FIRST_MATCH_SELECTORS,
+    instructions: INSTRUCTION_SECTION_FIRST_MATCH_SELECTORS,
+  };
+}
+
+/**
+ * Elements removed unconditionally while cleaning, grouped by the step they run in.
+ * Each group is a single comma-separated selector so Cheerio walks the tree once per
+ * group instead of once per category. Conditional removals (headers, WordPress blocks,
+ * time widgets) run between the groups, so the group boundaries preserve that order.
+ */
+const MEDIA_AND_NAVIGATION_SELECTOR_GROUP = [
+  // Styles, media and form elements
+  'style, noscript, link, meta, head, svg, symbol, img, button, iframe, video, audio, canvas, form, input, select, option, textarea',
+  // Navigation and site structure elements
+  'nav, .navbar, .nav, .navigation, .site-nav, .menu, .mobile-menu, [role="navigation"]',
+].join(', ');
+
+const PAGE_CHROME_SELECTOR_GROUP = [
+  // Footers
+  'footer, .footer, .site-footer, [role="contentinfo"]',
+  // Sidebars and secondary content
+  'aside, .sidebar, .side-bar, .secondary, [role="complementary"]',
+  // Ads, sponsors, and promotional content
+  '.ad, .ads, .advertisement, .sponsor, .sponsored, .promo, .promotion, .banner-ad, .ad-container, .ad-slot, .adsbygoogle, .outbrain, .taboola',
+  // Social sharing widgets and icons
+  '.social, .share, .sharing, .social-share, .share-buttons, .social-media, .follow, .social-icons, .network-icons',
+  // Comments sections
+  '.comments, .comment, .comment-section, #comments, #comment, [class*="comment"], [id*="comment"], [class*="disqus"], [id*="disqus"]',
+  // Rating widgets and user interactions
+  '.rating, .ratings, .reviews, .review, .stars, .rmp-rating-widget, .rmp-widgets-container',
+  // Newsletter signup forms and popups
+  '.newsletter, .subscribe, .subscription, .signup, .email-signup, .popup, .modal, .overlay, .push-modal, .push-subscribe',
+  // Breadcrumbs
+  '.breadcrumb, .breadcrumbs, .breadcrumb-container, .breadcrumbs-container',
+  // Author info boxes and bylines
+  '.author, .author-box, .author-info, .byline, .author-byline',
+  // Entry metadata and post metadata
+  '.entry-meta, .entry-metadata, .post-meta, .post-metadata, .entry-footer, .post-footer, .entry-date, .post-date',
+].join(', ');
+
+const UTILITY_AND_EMBED_SELECTOR_GROUP = [
+  // Print buttons and utility controls
+  '.print, .print-btn, .print-recipe, .printable, .jump-to-recipe, .scroll-to-top, .floating-btn',
+  // Search boxes and site search
+  '.search, .search-box, .search-container, .search-form, .site-search, .search-bar',
+  // App banners and mobile prompts
+  '.app-banner, .mobile-banner, .mobile-sticky, .open-app, .app-link, .download-app',
+  // Theme toggles and accessibility controls
+  '.theme-toggle, .dark-mode, .light-mode, .toggle-switch, .color-mode, .font-size-control',
+  // Tooltips, hints, and UI helpers
+  '.tooltip, .tooltips, .hint, .hovercard, .dropdown-menu, .dropdown',
+  // Related posts and recommendations
+  '.related, .related-posts, .recommendations, .you-may-like, .more-recipes, .thumb-grid',
+  // Video containers and hero videos
+  '.hero-video-container, .video-container, .video-wrapper',
+  // Embedded social media content
+  'lite-youtube, [class*="twitter"], [class*="instagram"], [class*="facebook"]',
+  // Google Custom Search Engine elements
+  'gcse, [class*="gcse"]',
+  // Screen reader text and accessibility helpers
+  '.screen-reader-text, .sr-only, .visually-hidden',
+  // Nutritional info boxes (not needed for parsing ingredients/instructions)
+  '[class*="nutrition"], [id*="nutrition"], [class*="calorie"], [id*="calorie"]',
+].join(', ');
+
+// Whitespace patterns for the final normalization pass, compiled once at module load.
+// Runs are collapsed to a single space first, so the space between two tags is
+// always exactly one character by the time the second pattern runs.
+const WHITESPACE_RUN_RE = /\s+/g;
+const SPACE_BETWEEN_TAGS_RE = /> </g;
+
 /**
  * Interface for HTML cleaning result
  */
 export interface CleanedHTML {
   success: boolean;
   html?: string;
+  jsonLd?: string[]; // JSON-LD script contents (whitespace collapsed), collected before cleaning
   error?: string;
 }
 
@@ -24,9 +283,10 @@ export interface CleanedHTML {
  * Prioritizes ingredients and directions sections for better AI parsing
  * 
  * @param rawHtml - The raw HTML content from a recipe page
+ * @param sourceUrl - URL the HTML was fetched from, used to try known site selectors first (optional)
  * @returns CleanedHTML object with success status and cleaned HTML or error
  */
-export function cleanRecipeHTML(rawHtml: string): CleanedHTML {
+export function cleanRecipeHTML(rawHtml: string, sourceUrl?: string): CleanedHTML {
   try {
     if (!rawHtml || rawHtml.trim().length === 0) {
       return {
@@ -35,8 +295,11 @@ export function cleanRecipeHTML(rawHtml: string): CleanedHTML {
       };
     }
 
+    // Drop scripts, styles, SVG and comments before parsing so they never become DOM nodes
+    const strippedHtml = stripIrrelevantMarkup(rawHtml);
+
     // Load HTML with Cheerio
-    const $ = cheerio.load(rawHtml);
+    const $ = loadHtml(strippedHtml);
 
     // STEP 0: Extract JSON-LD scripts FIRST (before any cleaning)
     // These are critical for structured data extraction and must be preserved
@@ -44,154 +307,124 @@ export function cleanRecipeHTML(rawHtml: string): CleanedHTML {
     $('script[type="application/ld+json"]').each((_, element) => {
       const scriptContent = $(element).html();
       if (scriptContent && scriptContent.trim()) {
-        jsonLdScripts.push(scriptContent);
+        // Collapse whitespace the same way the final HTML pass does, so raw newlines and
+        // tabs inside JSON string values (invalid JSON) become spaces and recipe text
+        // keeps the single spacing it had when JSON-LD was parsed out of the cleaned HTML
+        jsonLdScripts.push(scriptContent.replace(WHITESPACE_RUN_RE, ' '));
       }
     });
 
     // STEP 1: Extract recipe-specific sections FIRST (before removing other content)
     // This ensures we prioritize ingredients and directions
     
+    // Section selectors in priority order (known site selectors first)
+    const sectionSelectors = getSectionSelectors(sourceUrl);
+
     // Find recipe title
-    const recipeTitle = $('h1, .recipe-title, [class*="recipe-title"], [itemprop="name"]').first().text().trim() || 
-                        $('title').first().text().trim();
-
-    // Find ingredients sections (multiple common selectors)
-    // Added more flexible selectors for sites like Just One Cookbook
-    const ingredientSelectors = [
-      '[class*="ingredient"]',
-      '[id*="ingredient"]',
-      '[itemprop="recipeIngredient"]',
-      '[class*="ingredients-list"]',
-      '[id*="ingredients-list"]',
-      'ul.ingredients, ol.ingredients',
-      '.recipe-ingredients, #recipe-ingredients',
-      '[data-ingredients]',
-      // Just One Cookbook and similar sites
-      '.wprm-recipe-ingredients-container',
-      '.wprm-recipe-ingredient',
-      '[class*="wprm-recipe-ingredient"]',
-    ];
-    
+    const recipeTitle = $(TITLE_FIRST_MATCH_SELECTOR).first().text().trim() || 
+                        $('title:first').text().trim();
+
+    // Find ingredients sections (selectors are tried in priority order)
     let ingredientsHtml = '';
-    ingredientSelectors.forEach(selector => {
-      if (!ingredientsHtml) {
-        const $ingredients = $(selector);
-        if ($ingredients.length) {
-          // Get parent container if it's a list item
-          const $container = $ingredients.first().closest('[class*="ingredient"], [id*="ingredient"], section, div');
-          ingredientsHtml = $container.length ? $container.html() || '' : $ingredients.first().parent().html() || '';
-        }
+    for (const selector of sectionSelectors.ingredients) {
+      const $ingredient = $(selector).first();
+      if ($ingredient.length) {
+        // Get parent container if it's a list item
+        const $container = $ingredient.closest('[class*="ingredient"], [id*="ingredient"], section, div');
+        ingredientsHtml = $container.length ? $container.html() || '' : $ingredient.parent().html() || '';
+        if (ingredientsHtml) break;
       }
-    });
-
-    // Fallback: Look for headings that say "Ingredients" and get following content
-    if (!ingredientsHtml) {
-      const headings = $('h1, h2, h3, h4, h5, h6');
-      headings.each((_, heading) => {
-        const $heading = $(heading);
-        const headingText = $heading.text().trim().toLowerCase();
-        if (headingText === 'ingredients' || headingText.includes('ingredients')) {
-          // Get the next sibling element (usually a list or div)
-          let $next = $heading.next();
-          // If no next sibling, try parent's next sibling
-          if ($next.length === 0) {
-            $next = $heading.parent().next();
-          }
-          // If still nothing, look within the same parent
-          if ($next.length === 0) {
-            $next = $heading.parent().find('ul, ol, div').first();
-          }
-          if ($next.length > 0) {
-            ingredientsHtml = $next.html() || '';
-            return false; // Break the loop
-          }
-        }
-      });
     }
 
     // Find directions/instructions sections
-    const instructionSelectors = [
-      '[class*="instruction"]',
-      '[class*="direction"]',
-      '[id*="instruction"]',
-      '[id*="direction"]',
-      '[itemprop="recipeInstructions"]',
-      '[class*="steps"]',
-      '[id*="steps"]',
-      '.recipe-instructions, #recipe-instructions',
-      '.recipe-directions, #recipe-directions',
-      '[data-instructions]',
-      'ol.instructions, ul.instructions',
-      // Just One Cookbook and similar sites
-      '.wprm-recipe-instructions-container',
-      '.wprm-recipe-instruction',
-      '[class*="wprm-recipe-instruction"]',
-    ];
-    
     let instructionsHtml = '';
-    instructionSelectors.forEach(selector => {
-      if (!instructionsHtml) {
-        const $instructions = $(selector);
-        if ($instructions.length) {
-          const $container = $instructions.first().closest('[class*="instruction"], [class*="direction"], [class*="step"], section, div');
-          instructionsHtml = $container.length ? $container.html() || '' : $instructions.first().parent().html() || '';
-        }
+    for (const selector of sectionSelectors.instructions) {
+      const $instruction = $(selector).first();
+      if ($instruction.length) {
+        const $container = $instruction.closest('[class*="instruction"], [class*="direction"], [class*="step"], section, div');
+        instructionsHtml = $container.length ? $container.html() || '' : $instruction.parent().html() || '';
+        if (instructionsHtml) break;
       }
-    });
+    }
 
-    // Fallback: Look for headings that say "Instructions", "Directions", or "Steps"
-    if (!instructionsHtml) {
+    // Fallback: Look for headings that name a section and get following content
+    // Both fallbacks share one headings query, and each heading's text is read once
+    if (!ingredientsHtml || !instructionsHtml) {
       const headings = $('h1, h2, h3, h4, h5, h6');
-      headings.each((_, heading) => {
-        const $heading = $(heading);
-        const headingText = $heading.text().trim().toLowerCase();
-        if (
-          headingText === 'instructions' ||
-          headingText === 'directions' ||
-          headingText === 'steps' ||
-          headingText.includes('instructions') ||
-          headingText.includes('directions') ||
-          headingText.includes('steps')
-        ) {
-          // Get the next sibling element (usually a list or div)
-          let $next = $heading.next();
-          // If no next sibling, try parent's next sibling
-          if ($next.length === 0) {
-            $next = $heading.parent().next();
-          }
-          // If still nothing, look within the same parent
-          if ($next.length === 0) {
-            $next = $heading.parent().find('ol, ul, div').first();
+      const headingTexts = headings
+        .map((_, heading) => $(heading).text().trim().toLowerCase())
+        .get();
+
+      // Headings that say "Ingredients"
+      if (!ingredientsHtml) {
+        headings.each((index, heading) => {
+          const headingText = headingTexts[index];
+          if (headingText === 'ingredients' || headingText.includes('ingredients')) {
+            const $heading = $(heading);
+            // Get the next sibling element (usually a list or div)
+            let $next = $heading.next();
+            // If no next sibling, try parent's next sibling
+            if ($next.length === 0) {
+              $next = $heading.parent().next();
+            }
+            // If still nothing, look within the same parent
+            if ($next.length === 0) {
+              $next = $heading.parent().find('ul, ol, div').first();
+            }
+            if ($next.length > 0) {
+              ingredientsHtml = $next.html() || '';
+              return false; // Break the loop
+            }
           }
-          if ($next.length > 0) {
-            instructionsHtml = $next.html() || '';
-            return false; // Break the loop
+        });
+      }
+
+      // Headings that say "Instructions", "Directions", or "Steps"
+      if (!instructionsHtml) {
+        headings.each((index, heading) => {
+          const headingText = headingTexts[index];
+          if (
+            headingText === 'instructions' ||
+            headingText === 'directions' ||
+            headingText === 'steps' ||
+            headingText.includes('instructions') ||
+            headingText.includes('directions') ||
+            headingText.includes('steps')
+          ) {
+            const $heading = $(heading);
+            // Get the next sibling element (usually a list or div)
+            let $next = $heading.next();
+            // If no next sibling, try parent's next sibling
+            if ($next.length === 0) {
+              $next = $heading.parent().next();
+            }
+            // If still nothing, look within the same parent
+            if ($next.length === 0) {
+              $next = $heading.parent().find('ol, ul, div').first();
+            }
+            if ($next.length > 0) {
+              instructionsHtml = $next.html() || '';
+              return false; // Break the loop
+            }
           }
-        }
-      });
+        });
+      }
     }
 
     // STEP 2: Remove all non-essential elements
     // Remove scripts, styles, and media elements
     // IMPORTANT: Preserve JSON-LD scripts for structured data extraction
     $('script').each((_, element) => {
-      const $script = $(element);
       // Keep JSON-LD scripts, remove all others
-      if ($script.attr('type') !== 'application/ld+json') {
-        $script.remove();
+      // (read the attribute directly rather than wrapping every script in a Cheerio object)
+      if (element.attribs.type !== 'application/ld+json') {
+        $(element).remove();
       }
     });
-    // Remove other non-essential elements
-    $(
-      'style, noscript, link, meta, head, svg, symbol, img, button, iframe, video, audio, canvas, form, input, select, option, textarea'
-    ).remove();
-
-    // Remove navigation and site structure elements
-    $(
-      'nav, .navbar, .nav, .navigation, .site-nav, .menu, .mobile-menu, [role="navigation"]'
-    ).remove();
+    // Remove other non-essential elements, navigation and site structure
+    $(MEDIA_AND_NAVIGATION_SELECTOR_GROUP).remove();
 
-    // Remove header and footer elements (unless they contain recipe schema)
+    // Remove header elements (unless they contain recipe schema)
     $('header, .header, .site-header, [role="banner"]').each((_, element) => {
       const $element = $(element);
       if (!$element.find('script[type="application/ld+json"]').length) {
@@ -199,48 +432,8 @@ export function cleanRecipeHTML(rawHtml: string): CleanedHTML {
       }
     });
 
-    $('footer, .footer, .site-footer, [role="contentinfo"]').remove();
-
-    // Remove sidebars and secondary content
-    $('aside, .sidebar, .side-bar, .secondary, [role="complementary"]').remove();
-
-    // Remove ads, sponsors, and promotional content
-    $(
-      '.ad, .ads, .advertisement, .sponsor, .sponsored, .promo, .promotion, .banner-ad, .ad-container, .ad-slot, .adsbygoogle, .outbrain, .taboola'
-    ).remove();
-
-    // Remove social sharing widgets and icons
-    $(
-      '.social, .share, .sharing, .social-share, .share-buttons, .social-media, .follow, .social-icons, .network-icons'
-    ).remove();
-
-    // Remove comments sections
-    $(
-      '.comments, .comment, .comment-section, #comments, #comment, [class*="comment"], [id*="comment"], [class*="disqus"], [id*="disqus"]'
-    ).remove();
-
-    // Remove rating widgets and user interactions
-    $(
-      '.rating, .ratings, .reviews, .review, .stars, .rmp-rating-widget, .rmp-widgets-container'
-    ).remove();
-
-    // Remove newsletter signup forms and popups
-    $(
-      '.newsletter, .subscribe, .subscription, .signup, .email-signup, .popup, .modal, .overlay, .push-modal, .push-subscribe'
-    ).remove();
-
-    // Remove breadcrumbs and metadata
-    $(
-      '.breadcrumb, .breadcrumbs, .breadcrumb-container, .breadcrumbs-container'
-    ).remove();
-
-    // Remove author info boxes and bylines
-    $('.author, .author-box, .author-info, .byline, .author-byline').remove();
-
-    // Remove entry metadata and post metadata
-    $(
-      '.entry-meta, .entry-metadata, .post-meta, .post-metadata, .entry-footer, .post-footer, .entry-date, .post-date'
-    ).remove();
+    // Remove footers, sidebars, ads, social widgets, comments, ratings, popups and metadata
+    $(PAGE_CHROME_SELECTOR_GROUP).remove();
 
     // Remove WordPress plugin containers that aren't recipe-related
     $('.wp-block-group, .wp-block-buttons, .wp-block-embed, .widget').each(
@@ -256,50 +449,8 @@ export function cleanRecipeHTML(rawHtml: string): CleanedHTML {
       }
     );
 
-    // Remove print buttons and utility controls
-    $(
-      '.print, .print-btn, .print-recipe, .printable, .jump-to-recipe, .scroll-to-top, .floating-btn'
-    ).remove();
-
-    // Remove search boxes and site search
-    $(
-      '.search, .search-box, .search-container, .search-form, .site-search, .search-bar'
-    ).remove();
-
-    // Remove app banners and mobile prompts
-    $(
-      '.app-banner, .mobile-banner, .mobile-sticky, .open-app, .app-link, .download-app'
-    ).remove();
-
-    // Remove theme toggles and accessibility controls
-    $(
-      '.theme-toggle, .dark-mode, .light-mode, .toggle-switch, .color-mode, .font-size-control'
-    ).remove();
-
-    // Remove tooltips, hints, and UI helpers
-    $(
-      '.tooltip, .tooltips, .hint, .hovercard, .dropdown-menu, .dropdown'
-    ).remove();
-
-    // Remove related posts and recommendations
-    $(
-      '.related, .related-posts, .recommendations, .you-may-like, .more-recipes, .thumb-grid'
-    ).remove();
-
-    // Remove video containers and hero videos
-    $('.hero-video-container, .video-container, .video-wrapper').remove();
-
-    // Remove embedded social media content
-    $('lite-youtube, [class*="twitter"], [class*="instagram"], [class*="facebook"]').remove();
-
-    // Remove Google Custom Search Engine elements
-    $('gcse, [class*="gcse"]').remove();
-
-    // Remove screen reader text and accessibility helpers
-    $('.screen-reader-text, .sr-only, .visually-hidden').remove();
-
-    // Remove nutritional info boxes (not needed for parsing ingredients/instructions)
-    $('[class*="nutrition"], [id*="nutrition"], [class*="calorie"], [id*="calorie"]').remove();
+    // Remove utility controls, banners, related content, embeds and nutrition boxes
+    $(UTILITY_AND_EMBED_SELECTOR_GROUP).remove();
 
     // Remove prep time, cook time, serving size boxes (keep text if in main content)
     $('[class*="prep-time"], [class*="cook-time"], [class*="serving"], [class*="yield"], [class*="time"]').each((_, el) => {
@@ -339,34 +490,34 @@ export function cleanRecipeHTML(rawHtml: string): CleanedHTML {
 
     // Get remaining cleaned body content as fallback
     // Try multiple sources to ensure we get content
-    let remainingContent = $('body').html() || '';
+    // Keep a handle on the source element so duplicates can be removed in place later
+    let $remainingRoot = $('body').first();
+    let remainingContent = $remainingRoot.html() || '';
     if (!remainingContent || remainingContent.trim().length === 0) {
-      remainingContent = $('main, article, [role="main"]').html() || '';
+      $remainingRoot = $('main, article, [role="main"]').first();
+      remainingContent = $remainingRoot.html() || '';
     }
     // Final fallback: get any content from the page
     if (!remainingContent || remainingContent.trim().length === 0) {
-      remainingContent = $('div[class*="content"], div[class*="post"], div[class*="entry"]').first().html() || '';
+      $remainingRoot = $('div[class*="content"], div[class*="post"], div[class*="entry"]').first();
+      remainingContent = $remainingRoot.html() || '';
     }
 
     // If we found ingredients/instructions, prioritize them and add remaining content
     if (ingredientsHtml || instructionsHtml) {
       // Clean up the remaining content to remove duplicates
+      // This works directly on the already-parsed document instead of serializing
+      // the body and parsing it a second time (the extracted sections are already strings)
       if (remainingContent) {
-        const $remaining = cheerio.load(`<div>${remainingContent}</div>`);
-        
-        // Remove sections we already extracted
+        // Remove sections we already extracted (one grouped selector = one tree walk)
         if (ingredientsHtml) {
-          ingredientSelectors.forEach(selector => {
-            $remaining(selector).remove();
-          });
+          $remainingRoot.find(INGREDIENT_SECTION_SELECTOR_GROUP).remove();
         }
         if (instructionsHtml) {
-          instructionSelectors.forEach(selector => {
-            $remaining(selector).remove();
-          });
+          $remainingRoot.find(INSTRUCTION_SECTION_SELECTOR_GROUP).remove();
         }
 
-        const cleanedRemaining = $remaining('div').html() || '';
+        const cleanedRemaining = $remainingRoot.html() || '';
         
         // Only add remaining content if it's substantial and different
         if (cleanedRemaining && cleanedRemaining.trim().length > 100) {
@@ -382,7 +533,7 @@ export function cleanRecipeHTML(rawHtml: string): CleanedHTML {
     // Final check - if still empty, try one more time with minimal cleaning
     if (!optimizedHtml || optimizedHtml.trim().length === 0) {
       // Last resort: reload original HTML and do minimal cleaning
-      const $fallback = cheerio.load(rawHtml);
+      const $fallback = loadHtml(strippedHtml);
       $fallback('script, style, noscript, nav, header, footer, aside').remove();
       const fallbackContent = $fallback('body').html() || $fallback('main, article').html() || '';
       
@@ -398,13 +549,14 @@ export function cleanRecipeHTML(rawHtml: string): CleanedHTML {
 
     // Normalize whitespace in the HTML string
     optimizedHtml = optimizedHtml
-      .replace(/\s+/g, ' ') // Replace multiple spaces with single space
-      .replace(/>\s+</g, '><') // Remove spaces between tags
+      .replace(WHITESPACE_RUN_RE, ' ') // Replace multiple spaces with single space
+      .replace(SPACE_BETWEEN_TAGS_RE, '><') // Remove spaces between tags
       .trim();
 
     return {
       success: true,
       html: optimizedHtml,
+      jsonLd: jsonLdScripts,
     };
   } catch (error) {
     const errorMessage =
@@ -430,7 +582,7 @@ export function extractTextContent(rawHtml: string): string {
       return '';
     }
 
-    const $ = cheerio.load(cleaned.html);
+    const $ = loadHtml(cleaned.html);
     return $.text().trim();
   } catch (error) {
     console.error('Error extracting text content:', error);